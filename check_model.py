@@ -1,7 +1,32 @@
 """Проверка модели Vosk"""
-import vosk
+import os
 from pathlib import Path
 
+
+def _scan_model(path, required):
+    """
+    Один проход по директории модели (os.scandir, без лишних stat).
+    
+    Returns:
+        Кортеж (суммарный размер файлов, найденные файлы из required)
+    """
+    total = 0
+    found = set()
+    stack = [(path, '')]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                rel = rel_dir + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel + '/'))
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
+                    if rel in required:
+                        found.add(rel)
+    return total, found
+
+
 model_path = Path('models/vosk-model-ru-0.42')
 print('Проверка модели...')
 print(f'Путь: {model_path.absolute()}')
@@ -10,27 +35,30 @@ if not model_path.exists():
     print('❌ Модель не найдена!')
     exit(1)
 
+# vosk импортируется только после проверки пути — загрузка
+# C++ рантайма не нужна, если модели нет
+import vosk
+
 try:
     model = vosk.Model(str(model_path))
     print('✓ Модель загружена успешно!')
     
-    # Подсчет размера
-    total_size = sum(f.stat().st_size for f in model_path.rglob('*') if f.is_file())
-    size_mb = total_size / (1024 * 1024)
-    print(f'Размер модели: {size_mb:.1f} МБ')
-    
-    # Проверка ключевых файлов
+    # Ключевые файлы
     required_files = [
         'am/final.mdl',
         'graph/HCLG.fst',
         'conf/model.conf',
     ]
     
+    # Подсчет размера и проверка ключевых файлов за один проход
+    total_size, found_files = _scan_model(str(model_path), set(required_files))
+    size_mb = total_size / (1024 * 1024)
+    print(f'Размер модели: {size_mb:.1f} МБ')
+    
     print('\nПроверка ключевых файлов:')
     all_ok = True
     for file in required_files:
-        file_path = model_path / file
-        if file_path.exists():
+        if file in found_files:
             print(f'  ✓ {file}')
         else:
             print(f'  ❌ {file} - НЕ НАЙДЕН!')
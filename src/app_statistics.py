@@ -1,17 +1,56 @@
 """
 Модуль статистики использования приложения.
 
-Сохраняет данные между сессиями в JSON-файле.
+Сохраняет данные между сессиями: снимок в JSON-файле и журнал событий
+(одна JSON-строка на изменение), который сворачивается в снимок при
+запуске или при превышении COMPACT_SIZE.
 """
+import atexit
 import json
 import logging
+import os
+import sys
+import threading
 import time
 from pathlib import Path
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# orjson (C-расширение) быстрее stdlib json; без него — fallback на json
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    
+    _loads = json.loads
+
+# Интервал фоновой записи журнала статистики (секунды)
+SAVE_INTERVAL = 5.0
+
+# Размер журнала, после которого он сворачивается в снимок (байты)
+COMPACT_SIZE = 64 * 1024
+
+# Сколько дней хранить подневную статистику; более старые дни
+# сворачиваются в помесячные итоги
+DAILY_HISTORY_DAYS = 90
+
+# Шаблон пустой записи дня/месяца (копируется при создании)
+_FRESH_DAY = {"words": 0, "time": 0}
+
+# Файл статистики по умолчанию — в той же директории, что и config
+if getattr(sys, 'frozen', False):
+    _DEFAULT_STATS_FILE = Path(sys.executable).parent / 'stats.json'
+else:
+    _DEFAULT_STATS_FILE = Path(__file__).resolve().parent.parent / 'stats.json'
+
 
 class Statistics:
     """Класс для сбора и хранения статистики использования."""
@@ -23,87 +62,235 @@ class Statistics:
         Args:
             stats_file: Путь к файлу статистики (по умолчанию stats.json рядом с config)
         """
-        if stats_file is None:
-            # По умолчанию в той же директории что и config
-            import sys
-            if getattr(sys, 'frozen', False):
-                base_path = Path(sys.executable).parent
-            else:
-                base_path = Path(__file__).parent.parent
-            stats_file = base_path / 'stats.json'
-        
-        self.stats_file = Path(stats_file)
+        self.stats_file = _DEFAULT_STATS_FILE if stats_file is None else Path(stats_file)
+        self.log_file = self.stats_file.with_suffix('.log')
+        
+        # Кэш ключа текущего дня ("2024-01-15") до ближайшей полуночи
+        self._today_key = ""
+        self._today_expires = 0.0
+        
         self._data = self._load()
         
+        # Итоги дублируются в атрибутах: свойства и get_summary читают их
+        # без обращения к словарю _data
+        self._total_words = 0
+        self._total_time = 0
+        self._sessions_count = 0
+        self._sync_totals()
+        
+        # Отложенная запись: события копятся в памяти, фоновый поток
+        # дописывает их в журнал раз в SAVE_INTERVAL секунд
+        self._pending = []
+        self._dirty = False
+        self._lock = threading.RLock()
+        atexit.register(self.flush)
+        
+        # Сворачиваем журнал предыдущих запусков в снимок
+        if self.log_file.exists() and self.log_file.stat().st_size > 0:
+            self._compact()
+        
         # Текущая сессия
         self._session_start: Optional[float] = None
+        self._session_id: Optional[int] = None
         self._session_words = 0
+        
+        threading.Thread(target=self._flush_loop, daemon=True).start()
     
     def _load(self) -> dict:
-        """Загрузка статистики из файла."""
+        """Загрузка снимка статистики и воспроизведение журнала событий."""
         default = {
             "total_words": 0,
             "total_time_seconds": 0,
             "sessions_count": 0,
             "first_use": None,
             "last_use": None,
-            "daily": {}  # "2024-01-15": {"words": 100, "time": 3600}
+            "last_seq": 0,  # Номер последнего события, учтённого в снимке
+            "daily": {},  # "2024-01-15": {"words": 100, "time": 3600}
+            "monthly": {}  # "2023-10": {"words": 3000, "time": 90000}
         }
         
-        if not self.stats_file.exists():
-            return default
-        
-        try:
-            with open(self.stats_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            # Merge с defaults для обратной совместимости
-            for key, value in default.items():
-                if key not in data:
-                    data[key] = value
-            return data
-        except Exception as e:
-            logger.error(f"Ошибка загрузки статистики: {e}")
-            return default
+        data = default
+        if self.stats_file.exists():
+            try:
+                data = _loads(self.stats_file.read_bytes())
+                # Merge с defaults для обратной совместимости
+                for key, value in default.items():
+                    if key not in data:
+                        data[key] = value
+            except Exception as e:
+                logger.error(f"Ошибка загрузки статистики: {e}")
+                data = default
+        
+        if self.log_file.exists():
+            try:
+                with open(self.log_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            event = _loads(line)
+                        except ValueError:
+                            # Оборванная строка после аварийного завершения
+                            continue
+                        # События, уже свёрнутые в снимок, пропускаем
+                        if event.get("seq", 0) > data["last_seq"]:
+                            self._apply_event(data, event)
+            except Exception as e:
+                logger.error(f"Ошибка чтения журнала статистики: {e}")
+        
+        self._prune_daily(data)
+        return data
+    
+    @staticmethod
+    def _prune_daily(data: dict):
+        """Свернуть дни старше DAILY_HISTORY_DAYS в помесячные итоги."""
+        cutoff = (date.today() - timedelta(days=DAILY_HISTORY_DAYS)).isoformat()
+        daily = data["daily"]
+        old_days = [day for day in daily if day < cutoff]
+        if not old_days:
+            return
+        
+        monthly = data["monthly"]
+        for day in old_days:
+            stats = daily.pop(day)
+            month = monthly.setdefault(day[:7], _FRESH_DAY.copy())
+            month["words"] += stats.get("words", 0)
+            month["time"] += stats.get("time", 0)
+    
+    def _today(self) -> str:
+        """Ключ текущего дня, пересчитывается только при смене даты."""
+        if time.time() >= self._today_expires:
+            today = date.today()
+            self._today_key = today.isoformat()
+            tomorrow = datetime.combine(today + timedelta(days=1), datetime.min.time())
+            self._today_expires = tomorrow.timestamp()
+        return self._today_key
+    
+    @staticmethod
+    def _apply_event(data: dict, event: dict, day: Optional[str] = None):
+        """
+        Применить событие журнала к данным статистики.
+        
+        Args:
+            data: Словарь статистики
+            event: Событие {"seq", "ts", "session", и "start" | "words" | "time"}
+            day: Ключ дня события (по умолчанию вычисляется из "ts")
+        """
+        ts = event.get("ts", 0)
+        data["last_seq"] = event.get("seq", data["last_seq"])
+        
+        if event.get("start"):
+            data["sessions_count"] += 1
+            now = datetime.fromtimestamp(ts).isoformat()
+            if data["first_use"] is None:
+                data["first_use"] = now
+            data["last_use"] = now
+            return
+        
+        words = event.get("words", 0)
+        seconds = event.get("time", 0)
+        data["total_words"] += words
+        data["total_time_seconds"] += seconds
+        
+        # Обновляем дневную статистику
+        if day is None:
+            day = date.fromtimestamp(ts).isoformat()
+        bucket = data["daily"].setdefault(day, _FRESH_DAY.copy())
+        bucket["words"] += words
+        bucket["time"] += seconds
+    
+    def _append_event(self, event: dict):
+        """
+        Добавить событие: применить к данным и поставить в очередь на запись.
+        
+        Args:
+            event: Событие без полей "seq" и "ts" (они заполняются здесь)
+        """
+        with self._lock:
+            event["seq"] = self._data["last_seq"] + 1
+            event["ts"] = time.time()
+            self._apply_event(self._data, event, self._today())
+            self._sync_totals()
+            self._pending.append(event)
+            self._dirty = True
+    
+    def _sync_totals(self):
+        """Обновить атрибуты-итоги из словаря _data."""
+        data = self._data
+        self._total_words = data["total_words"]
+        self._total_time = data["total_time_seconds"]
+        self._sessions_count = data["sessions_count"]
     
     def _save(self):
-        """Сохранение статистики в файл."""
-        try:
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(self._data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.error(f"Ошибка сохранения статистики: {e}")
+        """Дописать накопленные события в журнал статистики."""
+        with self._lock:
+            self._dirty = False
+            if not self._pending:
+                return
+            
+            lines = b"".join(_dumps(e) + b"\n" for e in self._pending)
+            try:
+                with open(self.log_file, 'ab') as f:
+                    f.write(lines)
+                    log_size = f.tell()
+                self._pending.clear()
+            except Exception as e:
+                logger.error(f"Ошибка сохранения статистики: {e}")
+                return
+            
+            if log_size > COMPACT_SIZE:
+                self._compact()
+    
+    def flush(self):
+        """Немедленно записать накопленные события (при завершении работы)."""
+        if self._dirty:
+            self._save()
+    
+    def _flush_loop(self):
+        """Фоновая запись накопленных событий раз в SAVE_INTERVAL секунд."""
+        while True:
+            time.sleep(SAVE_INTERVAL)
+            self.flush()
+    
+    def _compact(self):
+        """Записать снимок статистики и очистить журнал событий."""
+        tmp_path = self.stats_file.with_suffix('.json.tmp')
+        with self._lock:
+            try:
+                # Запись во временный файл + атомарная замена: при сбое на диске
+                # остаётся либо старый, либо новый снимок, но не обрезанный.
+                # fsync намеренно не делаем — статистика некритична.
+                tmp_path.write_bytes(_dumps(self._data))
+                os.replace(tmp_path, self.stats_file)
+                # Все события учтены в снимке (last_seq) — журнал можно обнулить
+                open(self.log_file, 'w').close()
+            except Exception as e:
+                logger.error(f"Ошибка сжатия журнала статистики: {e}")
+                if tmp_path.exists():
+                    try:
+                        tmp_path.unlink()
+                    except OSError:
+                        pass
     
     def start_session(self):
         """Начало новой сессии."""
-        self._session_start = time.time()
+        self._session_start = time.monotonic()
         self._session_words = 0
-        self._data["sessions_count"] += 1
-        
-        now = datetime.now().isoformat()
-        if self._data["first_use"] is None:
-            self._data["first_use"] = now
-        self._data["last_use"] = now
+        self._append_event({"session": self._sessions_count + 1, "start": True})
+        self._session_id = self._sessions_count
         
-        logger.info(f"Сессия #{self._data['sessions_count']} начата")
+        logger.info(f"Сессия #{self._sessions_count} начата")
     
     def end_session(self):
         """Завершение сессии."""
         if self._session_start is None:
             return
         
-        session_time = time.time() - self._session_start
-        self._data["total_time_seconds"] += int(session_time)
-        
-        # Обновляем дневную статистику
-        today = date.today().isoformat()
-        if today not in self._data["daily"]:
-            self._data["daily"][today] = {"words": 0, "time": 0}
-        self._data["daily"][today]["time"] += int(session_time)
-        
+        session_time = time.monotonic() - self._session_start
+        self._append_event({"session": self._session_id, "time": int(session_time)})
         self._save()
         
         logger.info(f"Сессия завершена: {self._session_words} слов за {int(session_time)} сек")
         self._session_start = None
+        self._session_id = None
     
     def add_words(self, count: int):
         """
@@ -116,17 +303,7 @@ class Statistics:
             return
         
         self._session_words += count
-        self._data["total_words"] += count
-        
-        # Обновляем дневную статистику
-        today = date.today().isoformat()
-        if today not in self._data["daily"]:
-            self._data["daily"][today] = {"words": 0, "time": 0}
-        self._data["daily"][today]["words"] += count
-        
-        # Сохраняем каждые 10 слов
-        if self._session_words % 10 == 0:
-            self._save()
+        self._append_event({"session": self._session_id, "words": count})
     
     @property
     def session_words(self) -> int:
@@ -138,34 +315,32 @@ class Statistics:
         """Время текущей сессии в секундах."""
         if self._session_start is None:
             return 0
-        return int(time.time() - self._session_start)
+        return int(time.monotonic() - self._session_start)
     
     @property
     def total_words(self) -> int:
         """Всего слов за всё время."""
-        return self._data["total_words"]
+        return self._total_words
     
     @property
     def total_time(self) -> int:
         """Всего времени за всё время (секунды)."""
-        return self._data["total_time_seconds"]
+        return self._total_time
     
     @property
     def sessions_count(self) -> int:
         """Количество сессий."""
-        return self._data["sessions_count"]
+        return self._sessions_count
     
     @property
     def today_words(self) -> int:
         """Слов за сегодня."""
-        today = date.today().isoformat()
-        return self._data["daily"].get(today, {}).get("words", 0)
+        return self._data["daily"].get(self._today(), {}).get("words", 0)
     
     @property
     def today_time(self) -> int:
         """Время за сегодня (секунды)."""
-        today = date.today().isoformat()
-        return self._data["daily"].get(today, {}).get("time", 0)
+        return self._data["daily"].get(self._today(), {}).get("time", 0)
     
     def get_summary(self) -> dict:
         """
@@ -174,14 +349,15 @@ class Statistics:
         Returns:
             Словарь с ключевыми метриками
         """
+        today = self._data["daily"].get(self._today(), {})
         return {
-            "session_words": self.session_words,
+            "session_words": self._session_words,
             "session_time": self.session_time,
-            "today_words": self.today_words,
-            "today_time": self.today_time,
-            "total_words": self.total_words,
-            "total_time": self.total_time,
-            "sessions_count": self.sessions_count
+            "today_words": today.get("words", 0),
+            "today_time": today.get("time", 0),
+            "total_words": self._total_words,
+            "total_time": self._total_time,
+            "sessions_count": self._sessions_count
         }
     
     def format_time(self, seconds: int) -> str:
@@ -1,25 +1,110 @@
 """
 Модуль захвата аудио с микрофона через PyAudio.
 """
-import pyaudio
+import atexit
+import collections
 import logging
 import threading
 import time
-from queue import Queue
 
 logger = logging.getLogger(__name__)
 
+# Максимум чанков в очереди: при отставании распознавания старые чанки
+# вытесняются новыми, чтобы память не росла без ограничений
+MAX_QUEUED_CHUNKS = 50
+
+# Lazy import: PyAudio при импорте загружает DLL PortAudio
+_pyaudio = None
+
+
+def _get_pyaudio():
+    """Ленивая загрузка PyAudio при первом обращении к устройствам."""
+    global _pyaudio
+    if _pyaudio is None:
+        import pyaudio
+        _pyaudio = pyaudio
+    return _pyaudio
+
+
+# Общий экземпляр PyAudio для перечисления и проверки устройств.
+# Pa_Initialize на Windows опрашивает все драйверы и занимает десятки мс,
+# поэтому экземпляр создаётся один раз. Потоки записи (start/stop)
+# используют собственные экземпляры, чтобы не зависеть от его времени жизни.
+_pa_instance = None
+_pa_lock = threading.Lock()
+
+
+def _get_pa():
+    """Получить общий экземпляр PyAudio (создаётся лениво)."""
+    global _pa_instance
+    with _pa_lock:
+        if _pa_instance is None:
+            _pa_instance = _get_pyaudio().PyAudio()
+        return _pa_instance
+
+
+def _reset_pa():
+    """
+    Закрыть общий экземпляр PyAudio.
+    
+    PortAudio фиксирует список устройств при инициализации, поэтому
+    после сброса следующий вызов _get_pa() увидит подключённые/отключённые
+    устройства.
+    """
+    global _pa_instance
+    with _pa_lock:
+        if _pa_instance is not None:
+            try:
+                _pa_instance.terminate()
+            except Exception:
+                pass
+            _pa_instance = None
+
+
+atexit.register(_reset_pa)
+
+
+def _build_cp1251_table(source_encoding: str) -> tuple:
+    """
+    Таблица str.translate для перекодировки source_encoding → CP1251.
+    
+    Для однобайтовых кодировок перекодировка — это побайтовая таблица
+    0x80-0xFF, поэтому str.translate делает её за один проход на уровне C,
+    без промежуточных bytes.
+    
+    Returns:
+        (таблица, множество символов, которые перекодируются без потерь)
+    """
+    mapping = {}
+    for code in range(0x80, 0x100):
+        raw = bytes([code])
+        try:
+            mapping[ord(raw.decode(source_encoding))] = raw.decode('cp1251')
+        except UnicodeDecodeError:
+            # Байт не определён в одной из кодировок — символ не перекодируется
+            continue
+    alphabet = frozenset(map(chr, range(0x80))) | frozenset(map(chr, mapping))
+    return str.maketrans(mapping), alphabet
+
+
+# translate сам по себе пропускает незнакомые символы; encode/decode в этом
+# случае падал и стратегия не применялась — алфавит сохраняет это поведение
+_LATIN1_TO_CP1251, _LATIN1_ALPHABET = _build_cp1251_table('latin-1')
+_CP1252_TO_CP1251, _CP1252_ALPHABET = _build_cp1251_table('cp1252')
+
+
 class AudioCapture:
     """Класс для захвата аудио с микрофона в реальном времени."""
     
-    def __init__(self, sample_rate=16000, chunk_size=4000, channels=1, 
+    def __init__(self, sample_rate=16000, chunk_size=8000, channels=1, 
                  device_index=None, on_error=None):
         """
         Инициализация захвата аудио.
         
         Args:
             sample_rate: Частота дискретизации (Гц)
-            chunk_size: Размер чанка (количество фреймов)
+            chunk_size: Размер чанка (количество фреймов); 8000 = 500 мс при 16 кГц —
+                вдвое меньше вызовов callback, чем при 4000
             channels: Количество каналов (1 = моно)
             device_index: Индекс устройства (None = по умолчанию)
             on_error: Callback функция(error_message: str) при ошибках
@@ -32,7 +117,12 @@ class AudioCapture:
         self.audio = None
         self.stream = None
         self.is_recording = False
-        self.audio_queue = Queue()
+        # deque.append/popleft атомарны на уровне C — в callback PortAudio
+        # не нужны Lock/Condition из queue.Queue, для пробуждения хватает Event
+        self._dq = collections.deque(maxlen=MAX_QUEUED_CHUNKS)
+        self._chunk_evt = threading.Event()
+        self._dropped_chunks = 0
+        self._last_drop_warning = 0.0
         self.thread = None
         self._error_count = 0
         self._max_errors = 5
@@ -59,15 +149,27 @@ class AudioCapture:
                 logger.error(error_msg)
                 if self.on_error:
                     self.on_error(error_msg)
-                return (None, pyaudio.paAbort)
+                return (None, _pyaudio.paAbort)
         else:
             # Сбрасываем счётчик при успешном чтении
             self._error_count = 0
         
         if self.is_recording and in_data:
-            self.audio_queue.put(in_data)
-        
-        return (None, pyaudio.paContinue)
+            if len(self._dq) == MAX_QUEUED_CHUNKS:
+                # Очередь полна — deque вытеснит самый старый чанк
+                self._dropped_chunks += 1
+                now = time.monotonic()
+                if now - self._last_drop_warning >= 1.0:
+                    logger.warning(
+                        f"Распознавание не успевает за микрофоном, "
+                        f"отброшено старых чанков: {self._dropped_chunks}"
+                    )
+                    self._last_drop_warning = now
+                    self._dropped_chunks = 0
+            self._dq.append(in_data)
+            self._chunk_evt.set()
+        
+        return (None, _pyaudio.paContinue)
     
     def start(self):
         """Запуск захвата аудио с обработкой ошибок."""
@@ -78,6 +180,7 @@ class AudioCapture:
         self._error_count = 0
         
         try:
+            pyaudio = _get_pyaudio()
             self.audio = pyaudio.PyAudio()
             
             # Получаем информацию об устройстве
@@ -149,12 +252,10 @@ class AudioCapture:
             finally:
                 self.audio = None
         
-        # Очистка очереди
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except:
-                pass
+        # Очистка очереди — одна операция вместо поэлементного извлечения
+        self._dq.clear()
+        # Будим ждущий read_chunk: он сразу вернёт None, не дожидаясь таймаута
+        self._chunk_evt.set()
         
         logger.info("Захват аудио остановлен")
     
@@ -178,7 +279,8 @@ class AudioCapture:
             self.stop()
             time.sleep(delay)
             
-            # Проверяем доступность устройства
+            # Проверяем доступность устройства (по свежему списку устройств)
+            _reset_pa()
             if not self.is_device_available():
                 logger.warning(f"Устройство недоступно, ждём {delay:.1f}с...")
                 delay = min(delay * 2, 10.0)  # Exponential backoff, max 10s
@@ -205,22 +307,15 @@ class AudioCapture:
         Returns:
             True если устройство доступно, False иначе
         """
-        test_audio = None
         try:
-            test_audio = pyaudio.PyAudio()
+            audio = _get_pa()
             if self.device_index is not None:
-                test_audio.get_device_info_by_index(self.device_index)
+                audio.get_device_info_by_index(self.device_index)
             else:
-                test_audio.get_default_input_device_info()
+                audio.get_default_input_device_info()
             return True
         except (OSError, IOError):
             return False
-        finally:
-            if test_audio:
-                try:
-                    test_audio.terminate()
-                except:
-                    pass
     
     @staticmethod
     def _fix_device_name(name: str) -> str:
@@ -270,21 +365,19 @@ class AudioCapture:
         except (UnicodeDecodeError, UnicodeEncodeError):
             pass
         
+        chars = set(name)
+        
         # Стратегия 3: Latin-1 → CP1251 (классический случай)
-        try:
-            fixed = name.encode('latin-1').decode('cp1251')
+        if chars <= _LATIN1_ALPHABET:
+            fixed = name.translate(_LATIN1_TO_CP1251)
             if any(0x0400 <= ord(c) <= 0x04FF for c in fixed):
                 return fixed
-        except (UnicodeDecodeError, UnicodeEncodeError):
-            pass
         
         # Стратегия 4: CP1252 → CP1251
-        try:
-            fixed = name.encode('cp1252').decode('cp1251')
+        if chars <= _CP1252_ALPHABET:
+            fixed = name.translate(_CP1252_TO_CP1251)
             if any(0x0400 <= ord(c) <= 0x04FF for c in fixed):
                 return fixed
-        except (UnicodeDecodeError, UnicodeEncodeError):
-            pass
         
         # Если ничего не помогло — возвращаем как есть
         return name
@@ -298,31 +391,23 @@ class AudioCapture:
             Список словарей с информацией об устройствах
         """
         devices = []
-        audio = None
-        try:
-            audio = pyaudio.PyAudio()
-            for i in range(audio.get_device_count()):
-                try:
-                    info = audio.get_device_info_by_index(i)
-                    if info.get('maxInputChannels', 0) > 0:
-                        # Исправляем кодировку названия устройства
-                        raw_name = info.get('name', 'Unknown')
-                        fixed_name = AudioCapture._fix_device_name(raw_name)
-                        
-                        devices.append({
-                            'index': i,
-                            'name': fixed_name,
-                            'sample_rate': int(info.get('defaultSampleRate', 16000)),
-                            'channels': info.get('maxInputChannels', 1)
-                        })
-                except:
-                    pass
-        finally:
-            if audio:
-                try:
-                    audio.terminate()
-                except:
-                    pass
+        audio = _get_pa()
+        for i in range(audio.get_device_count()):
+            try:
+                info = audio.get_device_info_by_index(i)
+                if info.get('maxInputChannels', 0) > 0:
+                    # Исправляем кодировку названия устройства
+                    raw_name = info.get('name', 'Unknown')
+                    fixed_name = AudioCapture._fix_device_name(raw_name)
+                    
+                    devices.append({
+                        'index': i,
+                        'name': fixed_name,
+                        'sample_rate': int(info.get('defaultSampleRate', 16000)),
+                        'channels': info.get('maxInputChannels', 1)
+                    })
+            except:
+                pass
         return devices
     
     def read_chunk(self, timeout=1.0):
@@ -330,14 +415,26 @@ class AudioCapture:
         Чтение чанка аудиоданных из очереди.
         
         Args:
-            timeout: Таймаут ожидания (секунды)
+            timeout: Таймаут ожидания (секунды); None — ждать чанка без
+                ограничения, stop() разбудит ожидание
         
         Returns:
             Байты аудиоданных или None
         """
         try:
-            return self.audio_queue.get(timeout=timeout)
-        except:
+            return self._dq.popleft()
+        except IndexError:
+            pass
+        
+        self._chunk_evt.clear()
+        # Чанк мог прийти между popleft и clear — тогда не ждём;
+        # после stop() ждать тоже нечего
+        if not self._dq and self.is_recording:
+            self._chunk_evt.wait(timeout)
+        
+        try:
+            return self._dq.popleft()
+        except IndexError:
             return None
     
     def get_audio_generator(self):
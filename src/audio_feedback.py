@@ -2,7 +2,9 @@
 Модуль звуковой обратной связи.
 """
 import logging
+import queue
 import threading
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,28 @@ class AudioFeedback:
             enabled: Включить/выключить звуки
         """
         self.enabled = enabled and _winsound_available
+        
+        # Один фоновый поток воспроизводит звуки из очереди (создаётся лениво)
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+    
+    def _ensure_worker(self):
+        """Запустить фоновый поток воспроизведения, если он ещё не запущен."""
+        with self._worker_lock:
+            if self._worker is None:
+                self._queue = queue.Queue()
+                self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+                self._worker.start()
+    
+    def _worker_loop(self):
+        """Цикл воспроизведения звуков из очереди (поток-демон, живёт до выхода)."""
+        while True:
+            frequency, duration = self._queue.get()
+            try:
+                winsound.Beep(frequency, duration)
+            except Exception as e:
+                logger.debug(f"Ошибка воспроизведения звука: {e}")
     
     def _play_async(self, frequency: int, duration: int):
         """
@@ -48,13 +72,8 @@ class AudioFeedback:
         if not self.enabled:
             return
         
-        def _play():
-            try:
-                winsound.Beep(frequency, duration)
-            except Exception as e:
-                logger.debug(f"Ошибка воспроизведения звука: {e}")
-        
-        threading.Thread(target=_play, daemon=True).start()
+        self._ensure_worker()
+        self._queue.put((frequency, duration))
     
     def play_start(self):
         """Звук включения распознавания."""
@@ -71,15 +90,8 @@ class AudioFeedback:
     def play_ready(self):
         """Звук готовности."""
         # Два коротких бипа
-        def _play_ready():
-            try:
-                winsound.Beep(self.FREQ_READY, 80)
-                winsound.Beep(self.FREQ_READY + 200, 80)
-            except:
-                pass
-        
-        if self.enabled:
-            threading.Thread(target=_play_ready, daemon=True).start()
+        self._play_async(self.FREQ_READY, 80)
+        self._play_async(self.FREQ_READY + 200, 80)
     
     def play_pause(self):
         """Звук паузы."""
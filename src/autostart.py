@@ -3,10 +3,16 @@
 
 Использует реестр Windows (HKEY_CURRENT_USER) — не требует прав администратора.
 """
+import atexit
 import logging
 import sys
 import os
+import threading
 from pathlib import Path
+from typing import Optional
+
+if sys.platform == 'win32':
+    import winreg
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +20,29 @@ logger = logging.getLogger(__name__)
 REGISTRY_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
 APP_NAME = "VoiceInput"
 
+# Кэш состояния автозапуска. Сбрасывается фоновым потоком, который ждёт
+# изменения ключа Run через RegNotifyChangeKeyValue — повторные проверки
+# не обращаются к реестру, пока ключ не изменится.
+_cached_state: Optional[bool] = None
+_cache_lock = threading.Lock()
+# Счётчик изменений ключа Run: наблюдатель увеличивает его при каждом
+# событии. Прочитанное значение кэшируется, только если счётчик не сдвинулся
+# с момента до чтения — иначе оно могло устареть
+_generation = 0
+_watch_thread: Optional[threading.Thread] = None
+# Сериализует запуск наблюдателя (отдельно от _cache_lock: поток
+# наблюдателя сам берёт _cache_lock)
+_watch_start_lock = threading.Lock()
+
+REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+# Сколько ждать регистрации уведомления при запуске наблюдателя (секунды)
+WATCH_START_TIMEOUT = 1.0
+
+# Ключ Run открывается один раз (чтение + запись) и переиспользуется:
+# пара OpenKey/CloseKey стоит в разы дороже самого запроса значения
+_run_key_handle = None
+_run_key_lock = threading.Lock()
+
 
 def _get_app_path() -> str:
     """Получить путь к исполняемому файлу приложения."""
@@ -27,33 +56,186 @@ def _get_app_path() -> str:
         return f'"{python_exe}" "{script_path}"'
 
 
+# Команда запуска не меняется за время работы — вычисляется один раз
+_APP_PATH = _get_app_path()
+
+
+def _get_run_key():
+    """Получить открытый ключ Run (открывается при первом обращении)."""
+    global _run_key_handle
+    with _run_key_lock:
+        if _run_key_handle is None:
+            _run_key_handle = winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                REGISTRY_PATH,
+                0,
+                winreg.KEY_READ | winreg.KEY_WRITE
+            )
+        return _run_key_handle
+
+
+def _close_run_key():
+    """Закрыть ключ Run при завершении приложения."""
+    global _run_key_handle
+    with _run_key_lock:
+        if _run_key_handle is not None:
+            try:
+                winreg.CloseKey(_run_key_handle)
+            except OSError:
+                pass
+            _run_key_handle = None
+
+
+atexit.register(_close_run_key)
+
+
+def _set_cached_state(state: Optional[bool]):
+    """Обновить кэш состояния автозапуска (None — сбросить)."""
+    global _cached_state
+    with _cache_lock:
+        _cached_state = state
+
+
+def _store_read_state(state: bool, generation: int):
+    """Закэшировать прочитанное состояние, если ключ не менялся с начала чтения."""
+    global _cached_state
+    with _cache_lock:
+        if _generation == generation and _watch_thread is not None:
+            _cached_state = state
+
+
+def _invalidate_cache():
+    """Сбросить кэш и сдвинуть счётчик изменений (вызывает наблюдатель)."""
+    global _cached_state, _generation
+    with _cache_lock:
+        _generation += 1
+        _cached_state = None
+
+
+def _watch_run_key(key, registered: threading.Event):
+    """
+    Фоновый поток: сбрасывает кэш при каждом изменении ключа Run.
+    
+    Уведомление регистрируется асинхронно (с событием), поэтому
+    registered выставляется, когда оно действительно зарегистрировано.
+    
+    Args:
+        key: Открытый с KEY_NOTIFY ключ Run (закрывается при выходе)
+        registered: Выставляется после первой регистрации (или при ошибке)
+    """
+    global _watch_thread
+    import ctypes
+    from ctypes import wintypes
+    
+    # Собственные экземпляры библиотек: прототипы не меняют общий ctypes.windll
+    advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+    notify = advapi32.RegNotifyChangeKeyValue
+    notify.argtypes = [wintypes.HKEY, wintypes.BOOL, wintypes.DWORD,
+                       wintypes.HANDLE, wintypes.BOOL]
+    notify.restype = wintypes.LONG
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CreateEventW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+    kernel32.CreateEventW.restype = wintypes.HANDLE
+    kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    
+    # Событие с автосбросом: сигнализируется при изменении ключа
+    event = kernel32.CreateEventW(None, False, False, None)
+    try:
+        if not event:
+            logger.warning("Не удалось создать событие: код ошибки %s, кэш автозапуска отключён",
+                           ctypes.get_last_error())
+            return
+        rc = notify(int(key), False, REG_NOTIFY_CHANGE_LAST_SET, event, True)
+        if rc != 0:
+            logger.warning("RegNotifyChangeKeyValue вернул %s, кэш автозапуска отключён", rc)
+            return
+        registered.set()
+        while True:
+            kernel32.WaitForSingleObject(event, 0xFFFFFFFF)
+            # Сначала перерегистрация, затем сдвиг счётчика: изменение между
+            # пробуждением и регистрацией тоже обесценит начатые чтения
+            rc = notify(int(key), False, REG_NOTIFY_CHANGE_LAST_SET, event, True)
+            _invalidate_cache()
+            if rc != 0:
+                logger.warning("RegNotifyChangeKeyValue вернул %s, кэш автозапуска отключён", rc)
+                return
+    finally:
+        # Без наблюдателя кэш использовать нельзя
+        _watch_thread = None
+        _invalidate_cache()
+        registered.set()
+        if event:
+            kernel32.CloseHandle(event)
+        winreg.CloseKey(key)
+
+
+def _ensure_watcher() -> bool:
+    """
+    Запустить наблюдатель за ключом Run, если он ещё не запущен.
+    
+    Возвращается после регистрации уведомления об изменении ключа.
+    
+    Returns:
+        True если наблюдатель работает и кэшу можно доверять
+    """
+    global _watch_thread
+    if sys.platform != 'win32':
+        return False
+    with _watch_start_lock:
+        if _watch_thread is not None:
+            return True
+        try:
+            key = winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                REGISTRY_PATH,
+                0,
+                winreg.KEY_READ | winreg.KEY_NOTIFY
+            )
+        except OSError as e:
+            logger.warning("Не удалось отслеживать изменения автозапуска: %s", e)
+            return False
+        registered = threading.Event()
+        thread = threading.Thread(target=_watch_run_key, args=(key, registered), daemon=True)
+        _watch_thread = thread
+        thread.start()
+        registered.wait(WATCH_START_TIMEOUT)
+        # При ошибке регистрации поток уже сбросил _watch_thread
+        return _watch_thread is thread and registered.is_set()
+
+
 def is_autostart_enabled() -> bool:
     """
     Проверяет, включён ли автозапуск.
     
+    Результат кэшируется до изменения ключа Run в реестре.
+    
     Returns:
         True если автозапуск включён, False иначе
     """
+    with _cache_lock:
+        if _cached_state is not None and _watch_thread is not None:
+            return _cached_state
+    
+    # Наблюдатель запускаем до чтения, чтобы не пропустить изменение между ними
+    watching = _ensure_watcher()
+    with _cache_lock:
+        generation = _generation
+    
     try:
-        import winreg
-        
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            REGISTRY_PATH,
-            0,
-            winreg.KEY_READ
-        )
-        try:
-            value, _ = winreg.QueryValueEx(key, APP_NAME)
-            return bool(value)
-        except FileNotFoundError:
-            return False
-        finally:
-            winreg.CloseKey(key)
-            
+        value, _ = winreg.QueryValueEx(_get_run_key(), APP_NAME)
+        state = bool(value)
+    except FileNotFoundError:
+        state = False
     except Exception as e:
-        logger.error(f"Ошибка проверки автозапуска: {e}")
+        logger.error("Ошибка проверки автозапуска: %s", e)
         return False
+    
+    if watching:
+        _store_read_state(state, generation)
+    return state
 
 
 def enable_autostart() -> bool:
@@ -64,25 +246,26 @@ def enable_autostart() -> bool:
         True если успешно, False при ошибке
     """
     try:
-        import winreg
-        
-        app_path = _get_app_path()
+        app_path = _APP_PATH
+        key = _get_run_key()
         
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            REGISTRY_PATH,
-            0,
-            winreg.KEY_WRITE
-        )
+        # Запись в реестр дороже чтения — не перезаписываем тот же путь
         try:
-            winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, app_path)
-            logger.info(f"Автозапуск включён: {app_path}")
+            value, _ = winreg.QueryValueEx(key, APP_NAME)
+        except FileNotFoundError:
+            value = None
+        if value == app_path:
+            _set_cached_state(True)
+            logger.info("Автозапуск уже включён: %s", app_path)
             return True
-        finally:
-            winreg.CloseKey(key)
+        
+        winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, app_path)
+        _set_cached_state(True)
+        logger.info("Автозапуск включён: %s", app_path)
+        return True
             
     except Exception as e:
-        logger.error(f"Ошибка включения автозапуска: {e}")
+        logger.error("Ошибка включения автозапуска: %s", e)
         return False
 
 
@@ -94,27 +277,17 @@ def disable_autostart() -> bool:
         True если успешно, False при ошибке
     """
     try:
-        import winreg
-        
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            REGISTRY_PATH,
-            0,
-            winreg.KEY_WRITE
-        )
-        try:
-            winreg.DeleteValue(key, APP_NAME)
-            logger.info("Автозапуск отключён")
-            return True
-        except FileNotFoundError:
-            # Значение уже отсутствует
-            logger.info("Автозапуск уже был отключён")
-            return True
-        finally:
-            winreg.CloseKey(key)
-            
+        winreg.DeleteValue(_get_run_key(), APP_NAME)
+        _set_cached_state(False)
+        logger.info("Автозапуск отключён")
+        return True
+    except FileNotFoundError:
+        # Значение уже отсутствует
+        _set_cached_state(False)
+        logger.info("Автозапуск уже был отключён")
+        return True
     except Exception as e:
-        logger.error(f"Ошибка отключения автозапуска: {e}")
+        logger.error("Ошибка отключения автозапуска: %s", e)
         return False
 
 
@@ -132,3 +305,24 @@ def set_autostart(enabled: bool) -> bool:
         return enable_autostart()
     else:
         return disable_autostart()
+
+
+def sync_autostart(desired: bool) -> bool:
+    """
+    Приводит автозапуск к нужному состоянию, трогая реестр только при различии.
+    
+    Для включения значение Run сверяется с текущим путём приложения
+    (enable_autostart перезапишет устаревший путь, например после переноса
+    exe); для выключения достаточно кэша (см. is_autostart_enabled).
+    
+    Args:
+        desired: Требуемое состояние автозапуска
+        
+    Returns:
+        True если состояние совпадает с desired, False при ошибке
+    """
+    if desired:
+        return enable_autostart()
+    if not is_autostart_enabled():
+        return True
+    return disable_autostart()
@@ -1,18 +1,205 @@
 """
 Модуль управления конфигурацией приложения.
 """
+import atexit
+import copy
 import json
 import os
 import logging
 import shutil
-import tempfile
+import struct
+import sys
+import threading
+import weakref
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# orjson (C-расширение) быстрее stdlib json; без него — fallback на json
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    
+    _loads = json.loads
+
+# Задержка записи после set(): серия изменений из окна настроек сохраняется одним разом
+SAVE_DELAY = 0.25
+
+# ReadDirectoryChangesW: каталог открывается как файл с правом чтения списка,
+# события — переименование (атомарная запись) и изменение времени записи
+FILE_LIST_DIRECTORY = 0x0001
+FILE_SHARE_ALL = 0x00000007  # READ | WRITE | DELETE
+OPEN_EXISTING = 3
+FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+# Буфер событий; при переполнении ReadDirectoryChangesW возвращает 0 байт
+WATCH_BUFFER_SIZE = 4096
+
+# Кэш конфигов: (абсолютный путь, st_mtime_ns) -> полный (уже слитый с
+# defaults) конфиг в виде JSON-байтов. Повторные Config("config.json") не
+# читают файл и не сливают defaults, пока он не изменён. Байты неизменяемы:
+# каждый экземпляр получает свой словарь одним разбором, без deepcopy;
+# общий экземпляр — только через Config.get_instance.
+_CONFIG_CACHE = {}
+
+# Общие экземпляры Config по абсолютному пути (см. Config.get_instance)
+_INSTANCES = {}
+
+# Экземпляры с отложенной записью: один atexit-хук на все, без сильных ссылок
+_PENDING_SAVES = weakref.WeakSet()
+
+
+def _flush_pending():
+    """Дописывает на диск все отложенные изменения при выходе."""
+    for instance in list(_PENDING_SAVES):
+        instance._flush()
+
+
+atexit.register(_flush_pending)
+
+
+def _cache_store(path: Path, serialized: bytes):
+    """Запоминает JSON полного конфига под текущим mtime файла, вытесняя старые записи."""
+    try:
+        resolved = str(path.resolve())
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return
+    for key in [k for k in _CONFIG_CACHE if k[0] == resolved]:
+        del _CONFIG_CACHE[key]
+    _CONFIG_CACHE[(resolved, mtime)] = serialized
+
+
+# Конфигурация по умолчанию. Не изменяется: копию даёт Config._get_default_config()
+_DEFAULT_CONFIG = {
+    "audio": {
+        "sample_rate": 16000,
+        "chunk_size": 8000,  # Увеличено для меньших накладных расходов
+        "channels": 1,
+        "device_index": None  # None = устройство по умолчанию
+    },
+    "vosk": {
+        "model_path": "models/vosk-model-ru-0.42",
+        "language": "ru"
+    },
+    "hotkeys": {
+        "toggle": "win+h",
+        "pause": "ctrl+shift+p",
+        "hold_mode": False  # False = toggle, True = hold (push-to-talk)
+    },
+    "input": {
+        "method": "clipboard"  # clipboard or typing
+    },
+    "voice_commands": {
+        "запятая": ",",
+        "точка": ".",
+        "восклицательный знак": "!",
+        "вопросительный знак": "?",
+        "двоеточие": ":",
+        "точка с запятой": ";",
+        "новая строка": "\n",
+        "абзац": "\n\n",
+        "пробел": " "
+    },
+    "vad": {
+        "enabled": True,
+        "aggressiveness": 2  # 0-3, где 3 = максимальная фильтрация
+    },
+    "notifications": {
+        "enabled": True,       # Toast-уведомления
+        "sound_enabled": True  # Звуковая обратная связь
+    },
+    "auto_start": False,
+    "log_level": "INFO",
+    "tutorial_shown": False,
+    "check_updates": True,
+    "dark_theme": True  # Тёмная тема по умолчанию
+}
+
+
+# Настройки, доступные как обычные атрибуты Config: имя -> (ключ, значение по умолчанию).
+# Заполняются в _populate_attrs() при загрузке и после каждого set().
+_SETTING_ATTRS = {
+    "audio_sample_rate": ("audio.sample_rate", 16000),        # Частота дискретизации аудио
+    "audio_chunk_size": ("audio.chunk_size", 8000),           # Размер чанка аудио
+    "audio_channels": ("audio.channels", 1),                  # Количество каналов аудио
+    "audio_device_index": ("audio.device_index", None),       # Индекс устройства (None = по умолчанию)
+    "vosk_model_path": ("vosk.model_path", "models/vosk-model-ru-0.42"),  # Путь к модели Vosk
+    "vosk_words": ("vosk.words", True),                       # Информация о словах в результатах Vosk
+    "vosk_partial_words": ("vosk.partial_words", True),       # То же для частичных результатов
+    "hotkey_toggle": ("hotkeys.toggle", "ctrl+shift+v"),      # Включение/выключение
+    "hotkey_pause": ("hotkeys.pause", "ctrl+shift+p"),        # Пауза
+    "hotkey_hold_mode": ("hotkeys.hold_mode", False),         # False = toggle, True = hold (зажатие)
+    "voice_commands": ("voice_commands", {}),                 # Словарь голосовых команд
+    "input_method": ("input.method", "clipboard"),            # clipboard или typing
+    "vad_enabled": ("vad.enabled", True),                     # Включён ли VAD фильтр тишины
+    "vad_aggressiveness": ("vad.aggressiveness", 2),          # Агрессивность VAD (0-3)
+    "notifications_enabled": ("notifications.enabled", True), # Toast-уведомления
+    "sound_enabled": ("notifications.sound_enabled", True),   # Звуковая обратная связь
+    "auto_start": ("auto_start", False),                      # Автозапуск при старте
+    "log_level": ("log_level", "INFO"),                       # Уровень логирования
+}
+
+
+def _flatten(config: dict, prefix: str = "", sep: str = ".") -> dict:
+    """
+    Разворачивает вложенный конфиг в плоский словарь по точечным путям.
+    Промежуточные узлы тоже попадают в результат ("audio" -> dict).
+    """
+    flat = {}
+    for key, value in config.items():
+        path = f"{prefix}{sep}{key}" if prefix else key
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(_flatten(value, path, sep))
+    return flat
+
+
+# Все точечные пути конфигурации по умолчанию: если загруженный файл содержит
+# их все, слияние с defaults не нужно
+_DEFAULT_KEYS = frozenset(_flatten(_DEFAULT_CONFIG))
+
+
+def _changed_names(data: bytes) -> set:
+    """
+    Имена файлов (в нижнем регистре) из записей FILE_NOTIFY_INFORMATION.
+    
+    Запись: NextEntryOffset, Action, FileNameLength (DWORD), затем имя в UTF-16-LE.
+    """
+    names = set()
+    offset = 0
+    while True:
+        next_offset, _action, length = struct.unpack_from('<III', data, offset)
+        names.add(data[offset + 12:offset + 12 + length].decode('utf-16-le').lower())
+        if not next_offset:
+            return names
+        offset += next_offset
+
+
 class Config:
     """Класс для управления настройками приложения."""
     
+    # Без __dict__: атрибуты-настройки читаются на горячих путях
+    __slots__ = (
+        "config_path",
+        "config",
+        "_flat",
+        "_last_serialized",
+        "_dirty",
+        "_save_timer",
+        "_save_lock",
+        "_watch_thread",
+        "__weakref__",
+    ) + tuple(_SETTING_ATTRS)
+    
     def __init__(self, config_path="config.json"):
         """
         Инициализация конфигурации.
@@ -21,6 +208,8 @@ class Config:
             config_path: Путь к файлу конфигурации (может быть относительным или абсолютным)
         """
         self.config_path = Path(config_path)
+        # Последнее записанное содержимое файла: повторная запись того же пропускается
+        self._last_serialized = None
         # Если путь относительный и файл не найден, пробуем найти в текущей директории
         if not self.config_path.is_absolute() and not self.config_path.exists():
             # Пробуем найти в текущей рабочей директории
@@ -29,59 +218,183 @@ class Config:
                 self.config_path = current_dir
         
         self.config = self._load_config()
+        self._flat = _flatten(self.config)
+        self._populate_attrs()
+        
+        # Отложенное сохранение (см. set/_flush)
+        self._dirty = False
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+        
+        # Наблюдатель за файлом запускает только get_instance
+        self._watch_thread = None
+    
+    @classmethod
+    def get_instance(cls, config_path="config.json"):
+        """
+        Возвращает общий экземпляр Config для указанного пути.
+        
+        Args:
+            config_path: Путь к файлу конфигурации
+        """
+        key = str(Path(config_path).resolve())
+        instance = _INSTANCES.get(key)
+        if instance is None:
+            instance = cls(config_path)
+            _INSTANCES[key] = instance
+            # Наблюдение за внешними изменениями файла (только Windows)
+            if sys.platform == 'win32':
+                instance._watch_thread = threading.Thread(target=instance._watch_file, daemon=True)
+                instance._watch_thread.start()
+        return instance
     
     def _load_config(self):
         """Загрузка конфигурации с валидацией и восстановлением."""
-        defaults = self._get_default_config()
-        
         if not self.config_path.exists():
-            logger.info(f"Файл конфигурации не найден: {self.config_path}")
+            logger.info("Файл конфигурации не найден: %s", self.config_path)
             logger.info("Создаю файл с настройками по умолчанию")
+            defaults = self._get_default_config()
             self._save_config(defaults)
             return defaults
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
+            cache_key = (str(self.config_path.resolve()), self.config_path.stat().st_mtime_ns)
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                return _loads(cached)
+            
+            with open(self.config_path, 'rb') as f:
+                # Пустой файл определяем по размеру, не читая содержимое
+                if os.fstat(f.fileno()).st_size == 0:
+                    content = None
+                else:
+                    content = f.read()
             
             # Пустой файл
-            if not content:
+            if content is None:
                 logger.warning("Файл конфигурации пуст, использую defaults")
+                defaults = self._get_default_config()
                 self._save_config(defaults)
                 return defaults
             
-            # Парсинг JSON
-            loaded = json.loads(content)
-            
-            # Merge с defaults (заполняем недостающие поля)
-            merged = self._deep_merge(defaults, loaded)
+            # Парсинг JSON (пробелы по краям парсер пропускает сам)
+            loaded = _loads(content)
             
-            # Проверяем, были ли добавлены недостающие поля
-            if merged != loaded:
+            if _DEFAULT_KEYS.issubset(_flatten(loaded)):
+                # Все поля на месте — слияние с defaults ничего не добавит,
+                # в кэш идёт содержимое файла как есть
+                merged = loaded
+                serialized = content
+            else:
+                # Merge с defaults (заполняем недостающие поля)
+                merged = self._deep_merge(_DEFAULT_CONFIG, loaded)
+                serialized = _dumps(merged)
                 logger.info("Конфигурация дополнена недостающими полями")
             
-            logger.info(f"Конфигурация загружена из {self.config_path}")
+            logger.info("Конфигурация загружена из %s", self.config_path)
+            _cache_store(self.config_path, serialized)
             return merged
             
         except json.JSONDecodeError as e:
-            logger.error(f"Ошибка JSON в конфигурации: {e}")
+            logger.error("Ошибка JSON в конфигурации: %s", e)
             
             # Создаем backup битого файла
             backup_path = self.config_path.with_suffix('.json.broken')
             try:
                 shutil.copy(self.config_path, backup_path)
-                logger.info(f"Битый конфиг сохранён в {backup_path}")
+                logger.info("Битый конфиг сохранён в %s", backup_path)
             except Exception as backup_err:
-                logger.warning(f"Не удалось сохранить backup: {backup_err}")
+                logger.warning("Не удалось сохранить backup: %s", backup_err)
             
             logger.info("Использую настройки по умолчанию")
+            defaults = self._get_default_config()
             self._save_config(defaults)
             return defaults
             
         except Exception as e:
-            logger.error(f"Ошибка загрузки конфигурации: {e}")
+            logger.error("Ошибка загрузки конфигурации: %s", e)
             logger.info("Использую настройки по умолчанию")
-            return defaults
+            return self._get_default_config()
+    
+    def _watch_file(self):
+        """
+        Фоновый поток: перечитывает конфиг, когда файл изменён извне.
+        
+        Ждёт ReadDirectoryChangesW на каталоге конфига и реагирует только на
+        события с именем файла конфига: логи и статистика в том же каталоге
+        не приводят к обращению к файлу.
+        """
+        import ctypes
+        from ctypes import wintypes
+        
+        # Собственный экземпляр kernel32: прототипы не меняют общий ctypes.windll.kernel32
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                         wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+        kernel32.CreateFileW.restype = wintypes.HANDLE
+        kernel32.ReadDirectoryChangesW.argtypes = [wintypes.HANDLE, wintypes.LPVOID, wintypes.DWORD, wintypes.BOOL,
+                                                   wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+                                                   wintypes.LPVOID, wintypes.LPVOID]
+        kernel32.ReadDirectoryChangesW.restype = wintypes.BOOL
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        
+        handle = kernel32.CreateFileW(
+            str(self.config_path.parent), FILE_LIST_DIRECTORY, FILE_SHARE_ALL, None,
+            OPEN_EXISTING, FILE_FLAG_BACKUP_SEMANTICS, None
+        )
+        if not handle or handle == wintypes.HANDLE(-1).value:
+            logger.warning("Не удалось отслеживать изменения %s: код ошибки %s",
+                           self.config_path, ctypes.get_last_error())
+            return
+        
+        file_name = self.config_path.name.lower()
+        buffer = ctypes.create_string_buffer(WATCH_BUFFER_SIZE)
+        returned = wintypes.DWORD()
+        try:
+            while True:
+                if not kernel32.ReadDirectoryChangesW(
+                        handle, buffer, WATCH_BUFFER_SIZE, False,
+                        FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_LAST_WRITE,
+                        ctypes.byref(returned), None, None):
+                    logger.warning("Отслеживание изменений конфига прервано: код ошибки %s",
+                                   ctypes.get_last_error())
+                    break
+                # 0 байт — буфер переполнен, события потеряны: перечитываем на всякий случай
+                if not returned.value or file_name in _changed_names(buffer.raw[:returned.value]):
+                    self._reload_from_disk()
+        finally:
+            kernel32.CloseHandle(handle)
+    
+    def _reload_from_disk(self):
+        """Перечитывает файл после внешнего изменения и обновляет настройки."""
+        try:
+            with open(self.config_path, 'rb') as f:
+                content = f.read()
+            if not content:
+                # Пустой — файл ещё пишется
+                return
+            loaded = _loads(content)
+            serialized = content
+            if not _DEFAULT_KEYS.issubset(_flatten(loaded)):
+                loaded = self._deep_merge(_DEFAULT_CONFIG, loaded)
+                serialized = _dumps(loaded)
+        except Exception as e:
+            # Битый файл не трогаем: при следующем изменении попробуем снова
+            logger.warning("Не удалось перечитать конфигурацию: %s", e)
+            return
+        
+        with self._save_lock:
+            if self._dirty or content == self._last_serialized:
+                # Есть несохранённые изменения (они перезапишут файл) или это наша же запись
+                return
+            self.config = loaded
+            self._flat = _flatten(loaded)
+            self._populate_attrs()
+            # Повторные события той же записи не перечитывают файл снова
+            self._last_serialized = content
+        _cache_store(self.config_path, serialized)
+        logger.info("Конфигурация перечитана из %s", self.config_path)
     
     def _deep_merge(self, base: dict, override: dict) -> dict:
         """
@@ -90,64 +403,25 @@ class Config:
         override - словарь с переопределениями (loaded)
         Возвращает новый словарь с данными из override, дополненный из base.
         """
-        result = base.copy()
+        result = copy.deepcopy(base)
         
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                # Рекурсивное слияние вложенных словарей
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                # Переопределение значения
-                result[key] = value
+        # Обход без рекурсии: пары (узел результата, узел переопределений)
+        stack = [(result, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict) and isinstance(target.get(key), dict):
+                    # Вложенный словарь — сливаем на следующем шаге
+                    stack.append((target[key], value))
+                else:
+                    # Переопределение значения
+                    target[key] = value
         
         return result
     
     def _get_default_config(self):
-        """Получение конфигурации по умолчанию."""
-        return {
-            "audio": {
-                "sample_rate": 16000,
-                "chunk_size": 8000,  # Увеличено для меньших накладных расходов
-                "channels": 1,
-                "device_index": None  # None = устройство по умолчанию
-            },
-            "vosk": {
-                "model_path": "models/vosk-model-ru-0.42",
-                "language": "ru"
-            },
-            "hotkeys": {
-                "toggle": "win+h",
-                "pause": "ctrl+shift+p",
-                "hold_mode": False  # False = toggle, True = hold (push-to-talk)
-            },
-            "input": {
-                "method": "clipboard"  # clipboard or typing
-            },
-            "voice_commands": {
-                "запятая": ",",
-                "точка": ".",
-                "восклицательный знак": "!",
-                "вопросительный знак": "?",
-                "двоеточие": ":",
-                "точка с запятой": ";",
-                "новая строка": "\n",
-                "абзац": "\n\n",
-                "пробел": " "
-            },
-            "vad": {
-                "enabled": True,
-                "aggressiveness": 2  # 0-3, где 3 = максимальная фильтрация
-            },
-            "notifications": {
-                "enabled": True,       # Toast-уведомления
-                "sound_enabled": True  # Звуковая обратная связь
-            },
-            "auto_start": False,
-            "log_level": "INFO",
-            "tutorial_shown": False,
-            "check_updates": True,
-            "dark_theme": True  # Тёмная тема по умолчанию
-        }
+        """Получение конфигурации по умолчанию (независимая копия _DEFAULT_CONFIG)."""
+        return copy.deepcopy(_DEFAULT_CONFIG)
     
     def _save_config(self, config=None):
         """
@@ -157,28 +431,33 @@ class Config:
         if config is None:
             config = self.config
         
+        serialized = _dumps(config)
+        if serialized == self._last_serialized:
+            return
+        
         tmp_path = None
         try:
-            # Создаём временный файл в той же директории
+            # Временный файл в той же директории: один os.write готовых байтов
             dir_path = self.config_path.parent
             dir_path.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.config_path.with_suffix('.json.tmp')
             
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.json.tmp',
-                dir=str(dir_path),
-                delete=False,
-                encoding='utf-8'
-            ) as tmp:
-                json.dump(config, tmp, ensure_ascii=False, indent=2)
-                tmp_path = Path(tmp.name)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                view = memoryview(serialized)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
             
             # Атомарный rename (на Windows используем replace)
-            tmp_path.replace(self.config_path)
-            logger.info(f"Конфигурация сохранена в {self.config_path}")
+            os.replace(tmp_path, self.config_path)
+            self._last_serialized = serialized
+            _cache_store(self.config_path, serialized)
+            logger.info("Конфигурация сохранена в %s", self.config_path)
             
         except Exception as e:
-            logger.error(f"Ошибка при сохранении конфигурации: {e}")
+            logger.error("Ошибка при сохранении конфигурации: %s", e)
             # Удаляем временный файл если остался
             if tmp_path and tmp_path.exists():
                 try:
@@ -198,16 +477,7 @@ class Config:
         Returns:
             Значение конфигурации или default
         """
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def set(self, key, value):
         """
@@ -217,108 +487,74 @@ class Config:
             key: Ключ конфигурации (можно использовать точечную нотацию)
             value: Новое значение
         """
-        keys = key.split('.')
-        config = self.config
-        
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        
-        config[keys[-1]] = value
-        self._save_config()
-    
-    def save(self):
-        """Сохранение текущей конфигурации в файл."""
-        self._save_config()
-    
-    @property
-    def audio_sample_rate(self):
-        """Частота дискретизации аудио."""
-        return self.get("audio.sample_rate", 16000)
-    
-    @property
-    def audio_chunk_size(self):
-        """Размер чанка аудио."""
-        return self.get("audio.chunk_size", 4000)
+        self.update({key: value})
     
-    @property
-    def audio_channels(self):
-        """Количество каналов аудио."""
-        return self.get("audio.channels", 1)
-    
-    @property
-    def audio_device_index(self):
-        """Индекс аудиоустройства (None = по умолчанию)."""
-        return self.get("audio.device_index", None)
-    
-    @property
-    def vosk_model_path(self):
-        """Путь к модели Vosk."""
-        return self.get("vosk.model_path", "models/vosk-model-ru-0.42")
-    
-    @property
-    def vosk_words(self):
-        """Включать информацию о словах в результатах Vosk."""
-        return self.get("vosk.words", True)
-    
-    @property
-    def vosk_partial_words(self):
-        """Включать информацию о словах в частичных результатах Vosk."""
-        return self.get("vosk.partial_words", True)
-    
-    @property
-    def hotkey_toggle(self):
-        """Горячая клавиша для включения/выключения."""
-        return self.get("hotkeys.toggle", "ctrl+shift+v")
-    
-    @property
-    def hotkey_pause(self):
-        """Горячая клавиша для паузы."""
-        return self.get("hotkeys.pause", "ctrl+shift+p")
-    
-    @property
-    def hotkey_hold_mode(self):
-        """Режим горячей клавиши: False = toggle, True = hold (зажатие)."""
-        return self.get("hotkeys.hold_mode", False)
-    
-    @property
-    def voice_commands(self):
-        """Словарь голосовых команд."""
-        return self.get("voice_commands", {})
-    
-    @property
-    def input_method(self):
-        """Способ ввода текста: clipboard или typing."""
-        return self.get("input.method", "clipboard")
-
-    @property
-    def vad_enabled(self):
-        """Включён ли VAD фильтр тишины."""
-        return self.get("vad.enabled", True)
-    
-    @property
-    def vad_aggressiveness(self):
-        """Агрессивность VAD (0-3)."""
-        return self.get("vad.aggressiveness", 2)
+    def update(self, values):
+        """
+        Установка нескольких значений с одной пересборкой и одной записью на диск.
+        
+        Args:
+            values: Словарь {ключ (точечная нотация): новое значение}
+        """
+        # Под тем же замком, что и _reload_from_disk: перечитывание файла
+        # не может вклиниться между проверкой и изменением
+        with self._save_lock:
+            if not values:
+                return
+            
+            # Флаг выставляется до изменений: перечитывание их уже не затрёт.
+            # Значения не сравниваются с текущими (список мог быть изменён на
+            # месте, True == 1) — лишнюю запись отсекает _save_config по байтам
+            self._dirty = True
+            _PENDING_SAVES.add(self)
+            
+            for key, value in values.items():
+                keys = key.split('.')
+                config = self.config
+                
+                for k in keys[:-1]:
+                    if k not in config:
+                        config[k] = {}
+                    config = config[k]
+                
+                config[keys[-1]] = value
+            
+            self._flat = _flatten(self.config)
+            self._populate_attrs()
+            self._schedule_save()
     
-    @property
-    def notifications_enabled(self):
-        """Включены ли toast-уведомления."""
-        return self.get("notifications.enabled", True)
+    def _schedule_save(self):
+        """(Пере)запускает таймер записи. Вызывается под self._save_lock."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(SAVE_DELAY, self._flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
     
-    @property
-    def sound_enabled(self):
-        """Включена ли звуковая обратная связь."""
-        return self.get("notifications.sound_enabled", True)
+    def _flush(self):
+        """Записывает накопленные изменения на диск, если они есть."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            try:
+                self._save_config()
+                self._dirty = False
+                _PENDING_SAVES.discard(self)
+            except Exception:
+                # Ошибка уже залогирована в _save_config, повторим при следующем flush
+                pass
     
-    @property
-    def auto_start(self):
-        """Автозапуск при старте."""
-        return self.get("auto_start", False)
+    def save(self):
+        """Немедленное сохранение текущей конфигурации в файл."""
+        with self._save_lock:
+            self._dirty = True
+        self._flush()
     
-    @property
-    def log_level(self):
-        """Уровень логирования."""
-        return self.get("log_level", "INFO")
-
+    def _populate_attrs(self):
+        """Обновляет атрибуты-настройки из плоского словаря (см. _SETTING_ATTRS)."""
+        flat = self._flat
+        for attr, (key, default) in _SETTING_ATTRS.items():
+            setattr(self, attr, flat.get(key, default))
@@ -4,9 +4,75 @@
 """
 import logging
 import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Fade-in окна туториала: значения -alpha и интервал между ними (мс)
+FADE_IN_STEPS = tuple(min(i * 0.08, 1.0) for i in range(1, 14))
+FADE_IN_STEP_MS = 15
+# Если один шаг прозрачности занимает дольше (секунды), fade-in пропускается
+FADE_IN_MAX_STEP_TIME = 0.005
+# 'auto' — решает пробный шаг, 'on' — анимация всегда, 'off' — никогда
+TUTORIAL_FADE = 'auto'
+
+# Тексты туториала
+_HOW_TO_STEPS = (
+    "1️⃣  Нажмите Win+H для включения/выключения",
+    "2️⃣  Говорите — текст появится в активном окне",
+    "3️⃣  Голосовые команды: «точка», «запятая», «новая строка»",
+    "4️⃣  Иконка в трее: 🟢 Активен  ⚪ Готов  🔴 Ошибка",
+)
+
+_TIPS = (
+    "• Говорите чётко и не слишком быстро",
+    "• Откройте Настройки для выбора микрофона",
+    "• Скачайте большую модель для лучшего качества",
+    "• Режим зажатия: держите клавишу пока говорите",
+)
+
+# Сокращённая инструкция для окна на обычном Tkinter
+_FALLBACK_STEPS = (
+    "1️⃣  Нажмите Win+H для включения/выключения",
+    "2️⃣  Говорите — текст появится в активном окне",
+    "3️⃣  Голосовые команды: «точка», «запятая»",
+)
+
+# Не больше одного окна туториала (и интерпретатора Tk) одновременно
+_tutorial_lock = threading.Lock()
+
+# Реестр шрифтов CTkFont по (размер, насыщенность). Шрифт Tcl живёт в
+# интерпретаторе своего окна, поэтому реестр очищается при его закрытии;
+# доступ сериализован _tutorial_lock.
+_FONT_CACHE = {}
+
+
+def _font(ctk, size, weight="normal"):
+    """Получить общий CTkFont для размера и насыщенности (создаётся один раз)."""
+    key = (size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = ctk.CTkFont(size=size, weight=weight)
+        _FONT_CACHE[key] = font
+    return font
+
+# CustomTkinter загружается при первом показе окна (тяжёлый импорт: Tcl, PIL)
+_ctk = None
+
+
+def _get_ctk():
+    """Ленивая загрузка customtkinter; тема настраивается один раз."""
+    global _ctk
+    if _ctk is None:
+        try:
+            import customtkinter
+        except ImportError:
+            return None
+        customtkinter.set_appearance_mode("dark")
+        customtkinter.set_default_color_theme("blue")
+        _ctk = customtkinter
+    return _ctk
+
 
 def should_show_tutorial(config) -> bool:
     """Проверяет, нужно ли показать туториал."""
@@ -18,19 +84,29 @@ def mark_tutorial_shown(config):
     config.set("tutorial_shown", True)
 
 
-def show_tutorial(config, on_complete=None):
+def show_tutorial(config, on_complete=None, master=None):
     """
-    Показать окно туториала.
+    Показать окно туториала (если он ещё не был показан).
     
     Args:
         config: Объект конфигурации
         on_complete: Callback после закрытия туториала
+        master: Корень Tk приложения. Если задан, окно создаётся как Toplevel
+            в текущем (Tk) потоке; иначе — в отдельном потоке со своим корнем
     """
+    # Туториал уже показан — не создаём поток и не импортируем Tk
+    if not should_show_tutorial(config):
+        if on_complete:
+            on_complete()
+        return
+    
+    if not _tutorial_lock.acquire(blocking=False):
+        logger.info("Туториал уже открыт")
+        return
     
     def _show():
-        try:
-            import customtkinter as ctk
-        except ImportError:
+        ctk = _get_ctk()
+        if ctk is None:
             # Fallback на обычный Tkinter
             _show_fallback()
             return
@@ -38,9 +114,6 @@ def show_tutorial(config, on_complete=None):
         # =================================================================
         # 🎨 НАСТРОЙКА
         # =================================================================
-        ctk.set_appearance_mode("dark")
-        ctk.set_default_color_theme("blue")
-        
         COLORS = {
             'bg': '#0D0D0D',
             'card': '#1C1C1E',
@@ -52,17 +125,32 @@ def show_tutorial(config, on_complete=None):
             'fg_secondary': '#8E8E93',
         }
         
-        root = ctk.CTk()
+        root = ctk.CTk() if master is None else ctk.CTkToplevel(master)
+        # Окно скрыто, пока не собраны виджеты и не вычислена позиция:
+        # одна отрисовка сразу в центре экрана вместо прыжка из (0, 0)
+        root.withdraw()
+        
+        # Шрифты берутся из общего реестра и разделяются всеми виджетами
+        FONTS = {
+            'icon': _font(ctk, 48),
+            'name': _font(ctk, 28, "bold"),
+            'title': _font(ctk, 16, "bold"),
+            'subtitle': _font(ctk, 14),
+            'item': _font(ctk, 13),
+            'small': _font(ctk, 12),
+        }
+        
         root.title("Добро пожаловать!")
         root.resizable(False, False)
         root.configure(fg_color=COLORS['bg'])
+        # Поверх других окон — до первого отображения, без лишней перестановки окон
+        root.attributes('-topmost', True)
         
         def on_close():
             if dont_show_var.get():
                 mark_tutorial_shown(config)
             root.destroy()
-            if on_complete:
-                on_complete()
+            _finish()
         
         root.protocol("WM_DELETE_WINDOW", on_close)
         
@@ -78,33 +166,27 @@ def show_tutorial(config, on_complete=None):
                 border_width=1,
                 border_color=COLORS['border']
             )
-            card.pack(fill="x", pady=8, padx=4)
             
             # Заголовок с иконкой
-            header = ctk.CTkFrame(card, fg_color="transparent")
-            header.pack(fill="x", padx=20, pady=(16, 8))
-            
             ctk.CTkLabel(
-                header,
+                card,
                 text=f"{icon} {title}",
-                font=ctk.CTkFont(size=16, weight="bold"),
+                font=FONTS['title'],
                 text_color=COLORS['fg']
-            ).pack(anchor="w")
-            
-            # Элементы списка
-            for item in items:
-                ctk.CTkLabel(
-                    card,
-                    text=item,
-                    font=ctk.CTkFont(size=13),
-                    text_color=COLORS['fg_secondary'],
-                    anchor="w",
-                    justify="left"
-                ).pack(fill="x", padx=24, pady=2)
+            ).pack(anchor="w", padx=20, pady=(16, 8))
             
-            # Нижний отступ
-            ctk.CTkFrame(card, fg_color="transparent", height=12).pack()
+            # Элементы списка — одна многострочная метка вместо метки на пункт
+            ctk.CTkLabel(
+                card,
+                text="\n".join(items),
+                font=FONTS['item'],
+                text_color=COLORS['fg_secondary'],
+                anchor="w",
+                justify="left"
+            ).pack(fill="x", padx=24, pady=(2, 12))  # Нижний отступ карточки
             
+            # Карточка размещается целиком, когда все дочерние виджеты готовы
+            card.pack(fill="x", pady=8, padx=4)
             return card
         
         # =================================================================
@@ -117,14 +199,14 @@ def show_tutorial(config, on_complete=None):
         ctk.CTkLabel(
             header_frame,
             text="🎤",
-            font=ctk.CTkFont(size=48)
+            font=FONTS['icon']
         ).pack()
         
         # Название
         ctk.CTkLabel(
             header_frame,
             text="VoiceInput",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=FONTS['name'],
             text_color=COLORS['fg']
         ).pack(pady=(8, 0))
         
@@ -132,7 +214,7 @@ def show_tutorial(config, on_complete=None):
         ctk.CTkLabel(
             header_frame,
             text="Голосовой ввод текста для Windows",
-            font=ctk.CTkFont(size=14),
+            font=FONTS['subtitle'],
             text_color=COLORS['fg_secondary']
         ).pack(pady=(4, 0))
         
@@ -140,19 +222,13 @@ def show_tutorial(config, on_complete=None):
         # 📋 КОНТЕНТ
         # =================================================================
         content = ctk.CTkFrame(root, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=28)
         
         # Карточка: Как пользоваться
         create_card(
             content,
             "🚀",
             "Как пользоваться",
-            [
-                "1️⃣  Нажмите Win+H для включения/выключения",
-                "2️⃣  Говорите — текст появится в активном окне",
-                "3️⃣  Голосовые команды: «точка», «запятая», «новая строка»",
-                "4️⃣  Иконка в трее: 🟢 Активен  ⚪ Готов  🔴 Ошибка",
-            ]
+            _HOW_TO_STEPS
         )
         
         # Карточка: Советы
@@ -160,26 +236,24 @@ def show_tutorial(config, on_complete=None):
             content,
             "💡",
             "Советы",
-            [
-                "• Говорите чётко и не слишком быстро",
-                "• Откройте Настройки для выбора микрофона",
-                "• Скачайте большую модель для лучшего качества",
-                "• Режим зажатия: держите клавишу пока говорите",
-            ]
+            _TIPS
         )
         
+        # Контент размещается после заполнения — один проход раскладки
+        content.pack(fill="both", expand=True, padx=28)
+        
         # =================================================================
         # ✅ ЧЕКБОКС И КНОПКА
         # =================================================================
         footer = ctk.CTkFrame(root, fg_color="transparent")
         footer.pack(fill="x", padx=32, pady=(16, 32))
         
-        dont_show_var = ctk.BooleanVar(value=True)
+        dont_show_var = ctk.BooleanVar(master=root, value=True)
         checkbox = ctk.CTkCheckBox(
             footer,
             text="Больше не показывать",
             variable=dont_show_var,
-            font=ctk.CTkFont(size=12),
+            font=FONTS['small'],
             text_color=COLORS['fg_secondary'],
             fg_color=COLORS['accent'],
             hover_color=COLORS['accent_hover']
@@ -193,7 +267,7 @@ def show_tutorial(config, on_complete=None):
             command=on_close,
             height=48,
             corner_radius=12,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=FONTS['title'],
             fg_color=COLORS['accent'],
             hover_color=COLORS['accent_hover']
         )
@@ -203,32 +277,42 @@ def show_tutorial(config, on_complete=None):
         # 📍 ПОЗИЦИОНИРОВАНИЕ И АНИМАЦИЯ
         # =================================================================
         root.update_idletasks()
-        w, h = root.winfo_width(), root.winfo_height()
+        w, h = root.winfo_reqwidth(), root.winfo_reqheight()
         x = (root.winfo_screenwidth() - w) // 2
         y = (root.winfo_screenheight() - h) // 2
         root.geometry(f"+{x}+{y}")
         
-        # Поверх других окон
-        root.attributes('-topmost', True)
-        
-        # Fade-in анимация
+        # Fade-in анимация: окно показывается уже прозрачным
         root.attributes('-alpha', 0)
-        
-        def fade_in():
-            alpha = 0.0
-            def animate():
-                nonlocal alpha
-                alpha += 0.08
-                if alpha >= 1.0:
-                    root.attributes('-alpha', 1.0)
-                    return
-                root.attributes('-alpha', alpha)
-                root.after(15, animate)
-            animate()
-        
-        fade_in()
-        
-        root.mainloop()
+        root.deiconify()
+        
+        # Шаги прозрачности считаются заранее и планируются сразу все;
+        # каждый шаг — одна команда Tcl без разбора аргументов attributes()
+        def set_alpha(alpha):
+            root.tk.call('wm', 'attributes', root._w, '-alpha', alpha)
+        
+        if TUTORIAL_FADE == 'off':
+            animate = False
+        elif TUTORIAL_FADE == 'on':
+            animate = True
+        else:
+            # Пробный шаг: если композитор медленно применяет прозрачность,
+            # анимация будет дёргаться — сразу показываем окно целиком.
+            # Первая раскладка и отрисовка выполняются до замера, чтобы
+            # мерить только сам вызов -alpha
+            root.update_idletasks()
+            started = time.perf_counter()
+            set_alpha(FADE_IN_STEPS[0])
+            animate = time.perf_counter() - started <= FADE_IN_MAX_STEP_TIME
+        
+        if not animate:
+            set_alpha(1.0)
+        else:
+            for i, alpha in enumerate(FADE_IN_STEPS[1:], start=1):
+                root.after(i * FADE_IN_STEP_MS, set_alpha, alpha)
+        
+        if master is None:
+            root.mainloop()
     
     def _show_fallback():
         """Fallback на обычный Tkinter если CustomTkinter недоступен."""
@@ -237,13 +321,14 @@ def show_tutorial(config, on_complete=None):
             from tkinter import ttk
         except ImportError:
             logger.error("Tkinter недоступен для туториала")
-            if on_complete:
-                on_complete()
+            _finish()
             return
         
-        root = tk.Tk()
+        root = tk.Tk() if master is None else tk.Toplevel(master)
+        root.withdraw()
         root.title("Добро пожаловать в VoiceInput!")
         root.resizable(False, False)
+        root.attributes('-topmost', True)
         
         main = ttk.Frame(root, padding=20)
         main.pack(fill=tk.BOTH, expand=True)
@@ -254,33 +339,56 @@ def show_tutorial(config, on_complete=None):
         instructions_frame = ttk.LabelFrame(main, text="Как пользоваться", padding=10)
         instructions_frame.pack(fill=tk.X, pady=5)
         
-        for step in [
-            "1️⃣  Нажмите Win+H для включения/выключения",
-            "2️⃣  Говорите — текст появится в активном окне",
-            "3️⃣  Голосовые команды: «точка», «запятая»",
-        ]:
+        for step in _FALLBACK_STEPS:
             ttk.Label(instructions_frame, text=step, anchor="w").pack(fill=tk.X, pady=1)
         
-        dont_show_var = tk.BooleanVar(value=True)
+        dont_show_var = tk.BooleanVar(master=root, value=True)
         ttk.Checkbutton(main, text="Больше не показывать", variable=dont_show_var).pack(pady=10)
         
         def on_close():
             if dont_show_var.get():
                 mark_tutorial_shown(config)
             root.destroy()
-            if on_complete:
-                on_complete()
+            _finish()
         
         ttk.Button(main, text="Начать работу", command=on_close).pack(pady=10)
         root.protocol("WM_DELETE_WINDOW", on_close)
         
         root.update_idletasks()
-        w, h = root.winfo_width(), root.winfo_height()
+        w, h = root.winfo_reqwidth(), root.winfo_reqheight()
         x = (root.winfo_screenwidth() - w) // 2
         y = (root.winfo_screenheight() - h) // 2
         root.geometry(f"+{x}+{y}")
-        root.attributes('-topmost', True)
+        root.deiconify()
         
-        root.mainloop()
+        if master is None:
+            root.mainloop()
+    
+    def _release():
+        # Шрифты Tcl принадлежат интерпретатору закрытого окна
+        _FONT_CACHE.clear()
+        _tutorial_lock.release()
+    
+    def _finish():
+        """Окно закрыто: в режиме Toplevel освобождаем блокировку здесь."""
+        if master is not None:
+            _release()
+        if on_complete:
+            on_complete()
+    
+    if master is not None:
+        # Окно живёт в цикле событий приложения — строим его сразу
+        try:
+            _show()
+        except Exception:
+            _release()
+            raise
+        return
+    
+    def _run():
+        try:
+            _show()
+        finally:
+            _release()
     
-    threading.Thread(target=_show, daemon=True).start()
+    threading.Thread(target=_run, daemon=True).start()
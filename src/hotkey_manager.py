@@ -1,12 +1,31 @@
 """
 Модуль управления глобальными горячими клавишами.
 """
+import functools
 import logging
-import threading
 import keyboard
 
 logger = logging.getLogger(__name__)
 
+# Имена клавиш в комбинациях, которые библиотека keyboard называет иначе
+_KEY_ALIASES = {'win': 'windows'}
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_hotkey(hotkey):
+    """
+    Нормализация комбинации клавиш.
+    
+    Args:
+        hotkey: Комбинация клавиш
+    
+    Returns:
+        Нормализованная комбинация
+    """
+    # Приводим к нижнему регистру и убираем пробелы
+    return hotkey.lower().replace(" ", "")
+
+
 class HotkeyManager:
     """Класс для управления глобальными горячими клавишами."""
     
@@ -15,9 +34,9 @@ class HotkeyManager:
         self.hotkeys = {}
         self.callbacks = {}
         self.is_running = False
-        self.thread = None
         self._hold_hotkeys = {}  # Для режима зажатия
         self._hold_active = {}   # Отслеживание активных hold
+        self._hook_handles = {}  # Обработчики keyboard.add_hotkey для точечного снятия
     
     def register_hotkey(self, hotkey, callback, description="", hold_mode=False, 
                         on_release=None):
@@ -32,7 +51,7 @@ class HotkeyManager:
             on_release: Функция при отпускании (только для hold_mode)
         """
         try:
-            normalized = self._normalize_hotkey(hotkey)
+            normalized = _normalize_hotkey(hotkey)
             
             if hold_mode and on_release:
                 # Режим зажатия: регистрируем нажатие и отпускание
@@ -48,18 +67,34 @@ class HotkeyManager:
                         self._hold_active[normalized] = False
                         on_release()
                 
-                keyboard.add_hotkey(normalized, on_press_handler, suppress=False)
-                keyboard.on_release(lambda e: self._check_release(normalized, hotkey, on_release_handler))
+                self._hook_handles[normalized] = keyboard.add_hotkey(
+                    normalized, on_press_handler, suppress=False
+                )
+                
+                # Имена клавиш разбираются один раз, а не при каждом отпускании
+                keys = [_KEY_ALIASES.get(part, part) for part in normalized.split('+')]
+                
+                # Отпускание слушаем только на клавишах самой комбинации,
+                # а не на каждом событии клавиатуры
+                release_hooks = [
+                    keyboard.on_release_key(
+                        key,
+                        lambda e: self._check_release(normalized, on_release_handler)
+                    )
+                    for key in set(keys)
+                ]
                 
                 self._hold_hotkeys[normalized] = {
                     'callback': callback,
                     'on_release': on_release,
-                    'on_release_handler': on_release_handler
+                    'on_release_handler': on_release_handler,
+                    'keys': keys,
+                    'release_hooks': release_hooks
                 }
                 logger.info(f"Зарегистрирована горячая клавиша (hold): {normalized} ({description})")
             else:
                 # Обычный режим toggle
-                keyboard.add_hotkey(normalized, callback)
+                self._hook_handles[normalized] = keyboard.add_hotkey(normalized, callback)
                 logger.info(f"Зарегистрирована горячая клавиша (toggle): {normalized} ({description})")
             
             self.hotkeys[normalized] = hotkey
@@ -70,19 +105,17 @@ class HotkeyManager:
             logger.error(f"Ошибка при регистрации горячей клавиши {hotkey}: {e}")
             return False
     
-    def _check_release(self, normalized, hotkey, on_release_handler):
+    def _check_release(self, normalized, on_release_handler):
         """Проверка отпускания клавиш для hold режима."""
-        if normalized not in self._hold_hotkeys:
+        hold = self._hold_hotkeys.get(normalized)
+        if hold is None:
             return
         if not self._hold_active.get(normalized, False):
             return
         
         # Проверяем, отпущена ли основная клавиша или модификаторы
-        parts = hotkey.lower().replace('+', ' ').split()
-        for part in parts:
-            key_map = {'win': 'windows', 'ctrl': 'ctrl', 'alt': 'alt', 'shift': 'shift'}
-            key_to_check = key_map.get(part, part)
-            if not keyboard.is_pressed(key_to_check):
+        for key in hold['keys']:
+            if not keyboard.is_pressed(key):
                 on_release_handler()
                 return
     
@@ -94,17 +127,22 @@ class HotkeyManager:
             hotkey: Комбинация клавиш
         """
         try:
-            normalized = self._normalize_hotkey(hotkey)
+            normalized = _normalize_hotkey(hotkey)
             
             # Убираем hold-режим если был
             if normalized in self._hold_hotkeys:
+                for hook in self._hold_hotkeys[normalized]['release_hooks']:
+                    try:
+                        keyboard.unhook_key(hook)
+                    except:
+                        pass
                 del self._hold_hotkeys[normalized]
             if normalized in self._hold_active:
                 del self._hold_active[normalized]
             
             if normalized in self.hotkeys:
                 try:
-                    keyboard.remove_hotkey(normalized)
+                    keyboard.remove_hotkey(self._hook_handles.pop(normalized, normalized))
                 except:
                     pass
                 del self.hotkeys[normalized]
@@ -120,29 +158,12 @@ class HotkeyManager:
         """Отмена регистрации всех горячих клавиш."""
         for hotkey in list(self.hotkeys.keys()):
             self.unregister_hotkey(hotkey)
+        # Снимаем только свои обработчики — keyboard.unhook_all() задел бы чужие
         self._hold_hotkeys.clear()
         self._hold_active.clear()
-        # Снимаем все обработчики release
-        try:
-            keyboard.unhook_all()
-        except:
-            pass
+        self._hook_handles.clear()
         logger.info("Все горячие клавиши отменены")
     
-    def _normalize_hotkey(self, hotkey):
-        """
-        Нормализация комбинации клавиш.
-        
-        Args:
-            hotkey: Комбинация клавиш
-        
-        Returns:
-            Нормализованная комбинация
-        """
-        # Приводим к нижнему регистру и убираем пробелы
-        normalized = hotkey.lower().replace(" ", "")
-        return normalized
-    
     def start(self):
         """Запуск менеджера горячих клавиш."""
         if self.is_running:
@@ -3,7 +3,8 @@
 """
 import sys
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import queue
 import threading
 import time
 import os
@@ -23,8 +24,6 @@ else:
     sys.path.insert(0, str(Path(__file__).parent))
 
 from config import Config
-from audio_capture import AudioCapture
-from speech_recognition import SpeechRecognition
 from text_input import TextInput
 from voice_commands import VoiceCommands
 from system_tray import SystemTray
@@ -32,10 +31,10 @@ from hotkey_manager import HotkeyManager
 from notifications import Notifications
 from audio_feedback import AudioFeedback
 from vad import VoiceActivityDetector
-from autostart import is_autostart_enabled, set_autostart
+from autostart import is_autostart_enabled, sync_autostart
 from app_statistics import Statistics
-from model_manager import ModelManager
-from first_run import should_show_tutorial, show_tutorial
+from model_manager import ModelManager, AVAILABLE_MODELS
+from first_run import show_tutorial
 from updater import check_updates_on_startup
 
 
@@ -59,12 +58,95 @@ def get_base_path():
 # Определяем базовую директорию
 BASE_PATH = get_base_path()
 
-# Настройка логирования с ротацией
-log_file = BASE_PATH / 'voice_input.log'
+# Пути к файлам приложения — вычисляются один раз при загрузке модуля
+CONFIG_PATH = os.fspath(BASE_PATH / 'config.json')
+STATS_PATH = os.fspath(BASE_PATH / 'stats.json')
+MODELS_DIR = os.fspath(BASE_PATH / 'models')
+LOG_FILE = os.fspath(BASE_PATH / 'voice_input.log')
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler с буферизованной записью.
+    
+    Записи копятся в буфере файла (64 КБ); WARNING и выше сбрасываются
+    сразу, остальное — потоком записи логов (FlushingQueueListener).
+    Размер файла для ротации считается в памяти, без tell() на каждую запись.
+    """
+    
+    BUFFER_SIZE = 64 * 1024
+    
+    def __init__(self, *args, **kwargs):
+        self._bytes_written = 0
+        super().__init__(*args, **kwargs)
+    
+    # Атрибут errors у FileHandler появился только в Python 3.9
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                      encoding=self.encoding, errors=getattr(self, 'errors', None))
+        # Файл открывается на дозапись — начинаем счёт с текущего размера
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def emit(self, record):
+        # Как RotatingFileHandler.emit, но без flush() на каждую запись
+        # и с одним format() на запись
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.encoding or 'utf-8', getattr(self, 'errors', None) or 'strict'))
+            if (self.maxBytes > 0 and self._bytes_written
+                    and self._bytes_written + size >= self.maxBytes):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += size
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+
 
-# RotatingFileHandler: макс 5 МБ на файл, хранить 3 backup
-file_handler = RotatingFileHandler(
-    str(log_file),
+class FlushingQueueListener(QueueListener):
+    """
+    QueueListener, который сам сбрасывает буферы обработчиков.
+    
+    Единственный путь сброса логов: поток слушателя не реже раза в
+    FLUSH_INTERVAL секунд вызывает flush() обработчиков — отдельный
+    поток сброса в каждом обработчике не нужен.
+    """
+    
+    FLUSH_INTERVAL = 1.0
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_flush = time.monotonic()
+    
+    def _flush_handlers(self):
+        self._last_flush = time.monotonic()
+        for handler in self.handlers:
+            handler.flush()
+    
+    def dequeue(self, block):
+        while True:
+            try:
+                record = self.queue.get(block, timeout=self.FLUSH_INTERVAL)
+            except queue.Empty:
+                # Очередь простаивает — дописываем буфер на диск
+                self._flush_handlers()
+                continue
+            if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+                # При непрерывном потоке записей лог не отстаёт больше интервала
+                self._flush_handlers()
+            return record
+
+
+# Настройка логирования с ротацией
+# Макс 5 МБ на файл, хранить 3 backup
+file_handler = BufferedRotatingFileHandler(
+    LOG_FILE,
     maxBytes=5*1024*1024,  # 5 MB
     backupCount=3,
     encoding='utf-8'
@@ -78,21 +160,74 @@ console_handler.setFormatter(logging.Formatter(
     '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 ))
 
+# Запись в файл и консоль — в отдельном потоке: поток обработки аудио
+# только кладёт запись в очередь и не ждёт диска
+log_queue = queue.SimpleQueue()
+log_listener = FlushingQueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+log_listener.start()
+# Регистрируется раньше VoiceInputApp._cleanup, поэтому остановится после него
+# и успеет записать его сообщения
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    handlers=[file_handler, console_handler]
+    handlers=[QueueHandler(log_queue)]
 )
 
 logger = logging.getLogger(__name__)
 
+# Сколько секунд tooltip может показывать ту же сводку статистики
+TOOLTIP_STATS_TTL = 1.0
+
+# Одинаковый финальный текст в пределах этого окна (секунды) считается
+# повтором распознавателя; то же слово, сказанное позже, вводится как обычно
+DUPLICATE_FINAL_WINDOW = 1.0
+
+# Биты состояния приложения (VoiceInputApp._state)
+STATE_RUNNING = 0b001
+STATE_ACTIVE = 0b010
+STATE_PAUSED = 0b100
+# Цикл обработки аудио работает, пока оба бита выставлены
+STATE_RUN_AND_ACTIVE = STATE_RUNNING | STATE_ACTIVE
+
+# Период опроса очереди вызовов для потока Tk (мс)
+TK_QUEUE_POLL_MS = 50
+
+# Минимальный интервал обновления прогресса скачивания в окне (секунды)
+PROGRESS_UI_INTERVAL = 0.033
+
+# Предустановки качества в настройках: подпись кнопки -> (vad.aggressiveness, audio.chunk_size).
+# Порядок ключей — порядок кнопок
+QUALITY_PRESETS = {
+    "⚡ Быстрое": (3, 8000),
+    "⚖️ Баланс": (2, 8000),
+    "🎯 Точное": (1, 4000),
+}
+
+# Tkinter загружается при первом открытии окна и затем переиспользуется
+_tk_modules = None
+
+
+def _get_tk():
+    """Ленивая загрузка tkinter; возвращает (tk, ttk, messagebox) или None."""
+    global _tk_modules
+    if _tk_modules is None:
+        try:
+            import tkinter
+            from tkinter import ttk, messagebox
+        except ImportError:
+            return None
+        _tk_modules = (tkinter, ttk, messagebox)
+    return _tk_modules
+
+
 class VoiceInputApp:
     """Главный класс приложения голосового ввода."""
     
     def __init__(self):
         """Инициализация приложения."""
         # Используем базовую директорию для поиска config.json
-        config_path = BASE_PATH / 'config.json'
-        self.config = Config(str(config_path))
+        self.config = Config.get_instance(CONFIG_PATH)
         self.audio_capture = None
         self.speech_recognition = None
         self.text_input = TextInput(self.config.input_method)
@@ -107,18 +242,43 @@ class VoiceInputApp:
             enabled=self.config.vad_enabled
         )
         self.settings_window_open = False
+        # Окно управления моделями: корень и виджеты строк по id модели
+        self._model_manager_root = None
+        self._model_rows = {}
         
-        self.is_active = False
-        self.is_paused = False
+        # is_active / is_paused / running хранятся одной битовой маской,
+        # чтобы цикл обработки аудио проверял состояние одним сравнением
+        self._state = STATE_RUNNING
+        # Состояние меняют поток горячих клавиш, трей, загрузчик модели,
+        # поток обработки и shutdown(): read-modify-write маски под замком
+        self._state_lock = threading.Lock()
+        # Сброшено на время паузы: поток обработки ждёт на нём без опроса
+        self._not_paused = threading.Event()
+        self._not_paused.set()
+        # Один долгоживущий поток обработки; между сеансами ждёт на событии
         self.processing_thread = None
-        self.running = True
+        self._active_event = threading.Event()
+        # Выставляется, когда фоновая загрузка модели завершилась
+        self._model_ready = threading.Event()
+        # Скрытый корень Tk в основном потоке; окна создаются как Toplevel,
+        # другие потоки передают ему вызовы через очередь
+        self._tk_root = None
+        self._tk_queue = queue.SimpleQueue()
+        self._start_pending = False
+        # Единственный поток, ждущий загрузки модели для отложенного start()
+        self._start_waiter = None
         self._shutdown_in_progress = False
+        # Основной поток спит на этом событии до shutdown()
+        self._stop_event = threading.Event()
+        
+        # Сводка статистики для tooltip: (время, всего слов, сводка)
+        self._tooltip_cache = (0.0, None, None)
         
         # Статистика сессии
-        self.statistics = Statistics(BASE_PATH / 'stats.json')
+        self.statistics = Statistics(STATS_PATH)
         
         # Менеджер моделей
-        self.model_manager = ModelManager(BASE_PATH / 'models')
+        self.model_manager = ModelManager(MODELS_DIR)
         
         # Настройка уровня логирования
         log_level = getattr(logging, self.config.log_level.upper(), logging.INFO)
@@ -129,8 +289,58 @@ class VoiceInputApp:
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
     
+    def _set_state_bit(self, bit: int, value: bool):
+        """Выставить или сбросить бит состояния."""
+        with self._state_lock:
+            if value:
+                self._state |= bit
+            else:
+                self._state &= ~bit
+    
+    def _get_state(self) -> int:
+        """Снимок битовой маски состояния."""
+        with self._state_lock:
+            return self._state
+    
+    @property
+    def is_active(self) -> bool:
+        return bool(self._get_state() & STATE_ACTIVE)
+    
+    @is_active.setter
+    def is_active(self, value: bool):
+        self._set_state_bit(STATE_ACTIVE, value)
+    
+    @property
+    def is_paused(self) -> bool:
+        return bool(self._get_state() & STATE_PAUSED)
+    
+    @is_paused.setter
+    def is_paused(self, value: bool):
+        # Бит и событие меняются вместе, иначе параллельные pause/resume
+        # могут оставить событие сброшенным при снятом бите
+        with self._state_lock:
+            if value:
+                self._state |= STATE_PAUSED
+                self._not_paused.clear()
+            else:
+                self._state &= ~STATE_PAUSED
+                self._not_paused.set()
+    
+    @property
+    def running(self) -> bool:
+        return bool(self._get_state() & STATE_RUNNING)
+    
+    @running.setter
+    def running(self, value: bool):
+        self._set_state_bit(STATE_RUNNING, value)
+    
     def initialize(self):
-        """Инициализация всех компонентов с гибридной загрузкой моделей."""
+        """
+        Инициализация всех компонентов.
+        
+        Модель распознавания загружается в фоновом потоке (_load_model):
+        трей и горячие клавиши доступны сразу, start() дождётся модели.
+        """
         try:
             logger.info("Инициализация приложения...")
             
@@ -146,29 +356,65 @@ class VoiceInputApp:
             self.system_tray.set_loading("Загрузка модели...")
             self.notifications.show_loading("Загрузка модели распознавания...")
             
+            # Инициализация горячих клавиш (start() дождётся загрузки модели)
+            self.hotkey_manager.start()
+            self._register_hotkeys()
+            
+            # Загрузка модели — вне критического пути запуска
+            threading.Thread(target=self._load_model, daemon=True).start()
+            
+            logger.info("Инициализация завершена")
+            
+            # Показать туториал при первом запуске
+            show_tutorial(self.config, master=self._tk_root)
+            
+            # Проверка обновлений при запуске
+            check_updates_on_startup(self.config, self.notifications)
+            
+        except Exception as e:
+            logger.error("Ошибка при инициализации: %s", e, exc_info=True)
+            if self.system_tray:
+                self.system_tray.set_error("Ошибка инициализации")
+            self.audio_feedback.play_error()
+            self.notifications.show_error(f"Ошибка инициализации: {e}")
+            raise
+    
+    def _load_model(self):
+        """Гибридная загрузка моделей в фоновом потоке."""
+        # Сигнал фоновой загрузке: начальная модель загружена и трей обновлён
+        initial_ready = threading.Event()
+        try:
             # === Гибридная загрузка моделей ===
             # Ищем маленькую и большую модели
             small_model = None
             large_model = None
             configured_model = None
             
-            for model in self.model_manager.get_available_models():
-                if model['is_downloaded']:
-                    model_path = BASE_PATH / 'models' / model['id']
-                    if model['quality'] == 'basic':
-                        small_model = model_path
-                    elif model['quality'] == 'high':
-                        large_model = model_path
+            # Один проход по каталогу моделей вместо exists() на каждую
+            downloaded = self.model_manager.get_downloaded_paths()
+            for model in AVAILABLE_MODELS:
+                model_path = downloaded.get(model['id'])
+                if model_path is None:
+                    continue
+                if model['quality'] == 'basic':
+                    small_model = model_path
+                elif model['quality'] == 'high':
+                    large_model = model_path
             
             # Настроенная модель
             model_path = Path(self.config.vosk_model_path)
-            if not model_path.is_absolute():
-                model_path = BASE_PATH / model_path
-                if not model_path.exists() and hasattr(sys, '_MEIPASS'):
-                    model_path = Path(sys._MEIPASS) / self.config.vosk_model_path
-            
-            if model_path.exists():
-                configured_model = model_path
+            if not model_path.is_absolute() and model_path.parent == Path('models'):
+                # Модель из каталога models — уже есть в снимке
+                configured_model = downloaded.get(model_path.name)
+            
+            if configured_model is None:
+                if not model_path.is_absolute():
+                    model_path = BASE_PATH / model_path
+                    if not model_path.exists() and hasattr(sys, '_MEIPASS'):
+                        model_path = Path(sys._MEIPASS) / self.config.vosk_model_path
+                
+                if model_path.exists():
+                    configured_model = model_path
             
             # Стратегия загрузки:
             # 1. Если есть маленькая И большая — загружаем маленькую, потом большую в фоне
@@ -195,69 +441,71 @@ class VoiceInputApp:
                     f"Откройте настройки и скачайте модель."
                 )
             
-            # Загрузка начальной модели
-            logger.info(f"Загрузка модели: {initial_model.name}")
+            # Загрузка начальной модели (vosk импортируется только здесь,
+            # трей и уведомления уже показаны)
+            from speech_recognition import SpeechRecognition
+            
+            if use_hybrid:
+                # Большая модель читается с диска параллельно с маленькой
+                self._load_large_model_background(large_model, initial_ready)
+            
+            logger.info("Загрузка модели: %s", initial_model.name)
             self.speech_recognition = SpeechRecognition(
-                str(initial_model),
+                os.fspath(initial_model),
                 self.config.audio_sample_rate,
                 words=self.config.vosk_words,
                 partial_words=self.config.vosk_partial_words
             )
             
-            # Инициализация горячих клавиш ПОСЛЕ загрузки модели
-            self.hotkey_manager.start()
-            self._register_hotkeys()
-            
             # Обновляем иконку трея
             if use_hybrid:
                 self.system_tray.update_tooltip("VoiceInput: Готов (быстрая модель)")
                 self.notifications.show("VoiceInput", "Готов! Загрузка качественной модели в фоне...")
-                # Запускаем фоновую загрузку большой модели
-                self._load_large_model_background(large_model)
+                initial_ready.set()
             else:
                 self.system_tray.set_ready()
                 self.notifications.show_ready()
             
             self.audio_feedback.play_ready()
             
-            logger.info("Инициализация завершена")
-            
-            # Показать туториал при первом запуске
-            if should_show_tutorial(self.config):
-                show_tutorial(self.config)
-            
-            # Проверка обновлений при запуске
-            check_updates_on_startup(self.config, self.notifications)
-            
-            # Автозапуск если настроено
-            if self.config.auto_start:
-                self.toggle()
+            logger.info("Модель загружена")
             
         except Exception as e:
-            logger.error(f"Ошибка при инициализации: {e}", exc_info=True)
+            logger.error("Ошибка загрузки модели: %s", e, exc_info=True)
             if self.system_tray:
-                self.system_tray.set_error("Ошибка инициализации")
+                self.system_tray.set_error("Ошибка загрузки модели")
             self.audio_feedback.play_error()
-            self.notifications.show_error(f"Ошибка инициализации: {e}")
-            raise
+            self.notifications.show_error(f"Ошибка загрузки модели: {e}")
+            # Фоновая загрузка большой модели не должна ждать вечно
+            initial_ready.set()
+        finally:
+            # start() не ждёт дальше; без модели _process_audio сообщит об ошибке
+            self._model_ready.set()
+        
+        # Автозапуск если настроено (если пользователь не запустил сам)
+        if self.config.auto_start and self.speech_recognition and not self._start_pending:
+            self.start()
     
-    def _load_large_model_background(self, model_path: Path):
-        """Загрузка большой модели в фоновом потоке."""
+    def _load_large_model_background(self, model_path: Path, initial_ready: threading.Event):
+        """
+        Загрузка большой модели в фоновом потоке.
+        
+        Загрузка начинается сразу, параллельно с начальной моделью;
+        переключение происходит после установки initial_ready.
+        """
         def _load():
             try:
-                logger.info(f"Фоновая загрузка модели: {model_path.name}")
+                import vosk
                 
-                # Обновляем статус
-                if self.system_tray:
-                    self.system_tray.update_tooltip("VoiceInput: Загрузка качественной модели...")
+                logger.info("Фоновая загрузка модели: %s", model_path.name)
+                model = vosk.Model(os.fspath(model_path))
                 
-                # Загружаем большую модель
-                import vosk
-                large_model = vosk.Model(str(model_path))
+                # Ждём, пока загрузится начальная модель
+                initial_ready.wait()
                 
                 # Переключаемся на большую модель
                 if self.speech_recognition:
-                    if self.speech_recognition.switch_model(str(model_path)):
+                    if self.speech_recognition.switch_model(os.fspath(model_path), model=model):
                         logger.info("Переключено на качественную модель")
                         
                         # Обновляем конфиг
@@ -272,7 +520,7 @@ class VoiceInputApp:
                         logger.warning("Не удалось переключиться на большую модель")
                         
             except Exception as e:
-                logger.error(f"Ошибка фоновой загрузки модели: {e}")
+                logger.error("Ошибка фоновой загрузки модели: %s", e)
                 # Оставляем маленькую модель
         
         thread = threading.Thread(target=_load, daemon=True)
@@ -291,10 +539,28 @@ class VoiceInputApp:
             logger.warning("Приложение уже активно")
             return
         
+        if not self._model_ready.is_set():
+            if self._start_pending:
+                # Повторное нажатие до загрузки модели отменяет запуск
+                self._cancel_pending_start()
+                return
+            self._start_pending = True
+            logger.info("Модель ещё загружается, запуск после загрузки")
+            if self.system_tray:
+                self.system_tray.update_tooltip("VoiceInput: Загрузка модели... (запуск после загрузки)")
+            # После отмены и повторного нажатия старый ждущий поток ещё жив
+            # и сам увидит флаг — второй не нужен
+            if self._start_waiter is None or not self._start_waiter.is_alive():
+                self._start_waiter = threading.Thread(target=self._start_when_model_ready, daemon=True)
+                self._start_waiter.start()
+            return
+        
         try:
             logger.info("Запуск голосового ввода...")
             
             # Инициализация захвата аудио
+            from audio_capture import AudioCapture
+            
             self.audio_capture = AudioCapture(
                 sample_rate=self.config.audio_sample_rate,
                 chunk_size=self.config.audio_chunk_size,
@@ -316,9 +582,11 @@ class VoiceInputApp:
                 self.system_tray.set_active(True, False)
                 self._update_tooltip()
             
-            # Запуск потока обработки
-            self.processing_thread = threading.Thread(target=self._process_audio, daemon=True)
-            self.processing_thread.start()
+            # Будим поток обработки (создаётся при первом запуске)
+            self._active_event.set()
+            if self.processing_thread is None:
+                self.processing_thread = threading.Thread(target=self._process_audio_worker, daemon=True)
+                self.processing_thread.start()
             
             logger.info("Голосовой ввод запущен")
             
@@ -327,18 +595,41 @@ class VoiceInputApp:
             self.notifications.show_start()
             
         except Exception as e:
-            logger.error(f"Ошибка при запуске: {e}", exc_info=True)
+            logger.error("Ошибка при запуске: %s", e, exc_info=True)
             self.notifications.show_error(str(e))
             self.stop()
     
+    def _start_when_model_ready(self):
+        """Дождаться загрузки модели и выполнить отложенный start()."""
+        self._model_ready.wait()
+        if self._start_pending and self.running:
+            self._start_pending = False
+            self.start()
+    
+    def _cancel_pending_start(self):
+        """Отменить отложенный start() и вернуть tooltip загрузки."""
+        self._start_pending = False
+        logger.info("Отложенный запуск отменён")
+        if self.system_tray:
+            self.system_tray.update_tooltip("VoiceInput: Загрузка модели...")
+    
     def stop(self):
         """Остановка захвата и распознавания речи."""
         if not self.is_active:
+            # В режиме удержания отпускание клавиши до загрузки модели
+            # отменяет отложенный запуск
+            if self._start_pending:
+                self._cancel_pending_start()
             return
         
         logger.info("Остановка голосового ввода...")
         
+        # Событие сбрасывается раньше флага: вышедший из сеанса поток
+        # обработки уже не проснётся до следующего start()
+        self._active_event.clear()
         self.is_active = False
+        # Будим поток обработки, если он ждёт конца паузы
+        self.is_paused = False
         
         # Остановка захвата аудио
         if self.audio_capture:
@@ -367,7 +658,7 @@ class VoiceInputApp:
         
         self.is_paused = not self.is_paused
         status = "приостановлен" if self.is_paused else "возобновлён"
-        logger.info(f"Голосовой ввод {status}")
+        logger.info("Голосовой ввод %s", status)
         
         if self.system_tray:
             self.system_tray.set_active(True, self.is_paused)
@@ -375,52 +666,74 @@ class VoiceInputApp:
                 self.system_tray.stop_animation()
             self._update_tooltip()
     
+    def _process_audio_worker(self):
+        """Поток обработки: обрабатывает сеанс, пока активен, затем ждёт следующего."""
+        while True:
+            self._active_event.wait()
+            if not self.running:
+                return
+            self._process_audio()
+    
     def _process_audio(self):
-        """Обработка аудиопотока в отдельном потоке."""
+        """Обработка аудиопотока одного сеанса (до stop())."""
         if not self.speech_recognition:
             logger.error("Распознавание речи не инициализировано!")
             self.stop()
             return
         
-        last_final_text = ""
+        last_final_text = ""  # Последний финальный текст распознавателя (до обработки)
+        last_final_at = 0.0
+        last_speaking = None  # Последнее состояние, переданное в трей
         
-        while self.is_active and self.running:
-            if self.is_paused:
-                time.sleep(0.1)
+        while True:
+            state = self._get_state()
+            if state & STATE_RUN_AND_ACTIVE != STATE_RUN_AND_ACTIVE:
+                break
+            if state & STATE_PAUSED:
+                # После паузы состояние трея передаём заново
+                last_speaking = None
+                self._not_paused.wait()
                 continue
             
             try:
                 # Получаем аудио чанк
-                audio_chunk = self.audio_capture.read_chunk(timeout=0.5)
-                if not audio_chunk:
+                audio_capture = self.audio_capture
+                if audio_capture is None:
+                    continue
+                # Ждём чанк без таймаута: поток просыпается только с данными
+                # или по stop() (тогда read_chunk вернёт None)
+                audio_chunk = audio_capture.read_chunk(timeout=None)
+                if not audio_chunk or self._get_state() & STATE_PAUSED:
                     continue
                 
                 # VAD фильтр — пропускаем тишину для экономии CPU
                 is_speech = self.vad.is_speech(audio_chunk)
                 
-                # Обновляем анимацию трея
-                if self.system_tray:
+                # Обновляем анимацию трея только при смене речь/тишина
+                if is_speech != last_speaking and self.system_tray:
                     self.system_tray.set_speaking(is_speech)
+                    last_speaking = is_speech
                 
                 if not is_speech:
                     continue
                 
-                # Распознаем речь
-                text, is_final = self.speech_recognition.recognize_chunk(audio_chunk)
+                # Распознаем речь (частичные результаты не используются —
+                # не строим JSON для них на каждом чанке)
+                text, is_final = self.speech_recognition.recognize_chunk(audio_chunk, partial=False)
                 
                 if text:
                     if is_final:
+                        # Тот же финальный текст сразу после предыдущего — повтор
+                        # распознавателя: не обрабатываем и не вводим его снова
+                        now = time.monotonic()
+                        if text == last_final_text and now - last_final_at < DUPLICATE_FINAL_WINDOW:
+                            continue
+                        last_final_text = text
+                        last_final_at = now
+                        
                         # Финальный результат - обрабатываем и вводим
                         processed_text = self.voice_commands.process_text(text)
                         
-                        # Убираем предыдущий частичный текст если был
-                        if last_final_text and last_final_text != processed_text:
-                            # Можно добавить логику удаления, но это сложно
-                            pass
-                        
-                        # Сохраняем текст ДО добавления пробела для корректного сравнения в следующей итерации
-                        last_final_text = processed_text
-                        
                         # Вводим текст
                         if processed_text:
                             # Добавляем пробел в конце, если текст не заканчивается на пробел или перевод строки
@@ -434,13 +747,14 @@ class VoiceInputApp:
                             self.statistics.add_words(word_count)
                             self._update_tooltip()
                             
-                            # Безопасное логирование текста
-                            text_preview = processed_text[:100] + ('...' if len(processed_text) > 100 else '')
-                            logger.info(f"Введен текст: '{text_preview}' (слов: {word_count}, всего сессия: {self.statistics.session_words})")
+                            # Безопасное логирование текста (строку не собираем, если INFO отключён)
+                            if logger.isEnabledFor(logging.INFO):
+                                text_preview = processed_text[:100] + ('...' if len(processed_text) > 100 else '')
+                                logger.info("Введен текст: %r (слов: %s, всего сессия: %s)", text_preview, word_count, self.statistics.session_words)
                     # Частичные результаты можно использовать для отображения в UI
                 
             except Exception as e:
-                logger.error(f"Ошибка при обработке аудио: {e}", exc_info=True)
+                logger.error("Ошибка при обработке аудио: %s", e, exc_info=True)
                 time.sleep(0.1)
     
     def shutdown(self):
@@ -451,20 +765,25 @@ class VoiceInputApp:
         
         logger.info("Завершение работы приложения...")
         self.running = False
-        self.stop()
-        
-        if self.hotkey_manager:
-            self.hotkey_manager.stop()
-        
-        if self.system_tray:
-            self.system_tray.stop()
+        try:
+            self.stop()
+            
+            if self.hotkey_manager:
+                self.hotkey_manager.stop()
+            
+            if self.system_tray:
+                self.system_tray.stop()
+        finally:
+            # Будим основной поток в run() и поток обработки, чтобы он вышел
+            self._active_event.set()
+            self._stop_event.set()
         
         logger.info("Приложение завершено")
         sys.exit(0)
     
     def _signal_handler(self, signum, frame):
         """Обработчик сигналов для graceful shutdown."""
-        logger.info(f"Получен сигнал {signum}, завершение...")
+        logger.info("Получен сигнал %s, завершение...", signum)
         self.shutdown()
     
     def _cleanup(self):
@@ -481,6 +800,12 @@ class VoiceInputApp:
             except:
                 pass
         
+        # Запись накопленной статистики
+        try:
+            self.statistics.flush()
+        except:
+            pass
+        
         # Освобождение mutex
         try:
             release_mutex()
@@ -513,22 +838,55 @@ class VoiceInputApp:
     def run(self):
         """Запуск приложения."""
         try:
+            tk_modules = _get_tk()
+            if tk_modules is not None:
+                self._tk_root = tk_modules[0].Tk()
+                self._tk_root.withdraw()
+            
             self.initialize()
             
-            # Основной цикл
-            while self.running:
-                time.sleep(1)
+            if self._tk_root is not None:
+                # Основной поток — поток Tk: обслуживает окна до shutdown()
+                self._tk_root.after(TK_QUEUE_POLL_MS, self._drain_tk_queue)
+                self._tk_root.mainloop()
+            else:
+                # Без Tk основной поток просто ждёт завершения
+                self._stop_event.wait()
                 
         except KeyboardInterrupt:
             logger.info("Получен сигнал прерывания")
             self.shutdown()
         except Exception as e:
-            logger.error(f"Критическая ошибка: {e}", exc_info=True)
+            logger.error("Критическая ошибка: %s", e, exc_info=True)
             self.shutdown()
 
+    def _call_in_tk(self, func, *args):
+        """Выполнить func(*args) в основном потоке Tk (из любого потока)."""
+        if self._tk_root is None:
+            logger.error("Tkinter недоступен")
+            return
+        self._tk_queue.put((func, args))
+    
+    def _drain_tk_queue(self):
+        """Выполнить вызовы, переданные из других потоков (в потоке Tk)."""
+        while True:
+            try:
+                func, args = self._tk_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error("Ошибка в окне: %s", e, exc_info=True)
+        
+        if self._stop_event.is_set():
+            self._tk_root.destroy()
+        else:
+            self._tk_root.after(TK_QUEUE_POLL_MS, self._drain_tk_queue)
+    
     def _on_audio_error(self, error_msg: str):
         """Обработчик ошибок аудио захвата."""
-        logger.error(f"Ошибка аудио: {error_msg}")
+        logger.error("Ошибка аудио: %s", error_msg)
         self.notifications.show_error(error_msg)
         self.audio_feedback.play_error()
         if self.system_tray:
@@ -539,48 +897,51 @@ class VoiceInputApp:
         if not self.system_tray:
             return
         
-        lines = ["VoiceInput"]
+        # Строки tooltip: заголовок, статус, сессия, время, сегодня, всего.
+        # Список фиксированного размера; пустые слоты пропускаются при сборке
+        lines = [""] * 6
+        lines[0] = "VoiceInput"
         
         # Статус
         if self.is_active:
-            if self.is_paused:
-                lines.append("⏸ Пауза")
-            else:
-                lines.append("🎤 Активен")
+            lines[1] = "⏸ Пауза" if self.is_paused else "🎤 Активен"
         else:
-            lines.append("⏹ Неактивен")
+            lines[1] = "⏹ Неактивен"
         
-        # Статистика сессии
-        stats = self.statistics.get_summary()
+        # Статистика сессии: сводка переиспользуется до секунды, пока
+        # не изменилось число слов
+        now = time.monotonic()
+        total_words = self.statistics.total_words
+        cached_at, cached_words, stats = self._tooltip_cache
+        if stats is None or cached_words != total_words or now - cached_at >= TOOLTIP_STATS_TTL:
+            stats = self.statistics.get_summary()
+            self._tooltip_cache = (now, total_words, stats)
         
         if self.is_active:
-            # Слов в сессии
-            lines.append(f"Сессия: {stats['session_words']} слов")
-            # Время сессии
-            lines.append(f"Время: {self.statistics.format_time(stats['session_time'])}")
-        
-        # Статистика за сегодня
-        lines.append(f"Сегодня: {stats['today_words']} слов")
+            # Слов и время сессии
+            lines[2] = f"Сессия: {stats['session_words']} слов"
+            lines[3] = f"Время: {self.statistics.format_time(stats['session_time'])}"
         
-        # Всего
-        lines.append(f"Всего: {stats['total_words']} слов")
+        # Статистика за сегодня и за всё время
+        lines[4] = f"Сегодня: {stats['today_words']} слов"
+        lines[5] = f"Всего: {stats['total_words']} слов"
         
-        tooltip = "\n".join(lines)
+        tooltip = "\n".join(filter(None, lines))
         self.system_tray.update_tooltip(tooltip)
     
     def _count_words(self, text: str) -> int:
         """Подсчёт слов в тексте."""
-        if not text:
-            return 0
-        # Простой подсчёт — разделение по пробелам
-        words = [w for w in text.split() if w.strip()]
-        return len(words)
+        # split() без аргументов уже отбрасывает пустые части
+        return len(text.split()) if text else 0
     
     def _register_hotkeys(self):
         """Регистрация горячих клавиш согласно текущей конфигурации."""
-        hold_mode = self.config.hotkey_hold_mode
-        
-        if hold_mode:
+        self._register_toggle_hotkey()
+        self._register_pause_hotkey()
+    
+    def _register_toggle_hotkey(self):
+        """Регистрация клавиши включения (toggle или режим зажатия)."""
+        if self.config.hotkey_hold_mode:
             # Режим зажатия: start при нажатии, stop при отпускании
             self.hotkey_manager.register_hotkey(
                 self.config.hotkey_toggle,
@@ -596,8 +957,9 @@ class VoiceInputApp:
                 self.toggle,
                 "Включить/выключить"
             )
-        
-        # Пауза всегда toggle
+    
+    def _register_pause_hotkey(self):
+        """Регистрация клавиши паузы (всегда toggle)."""
         self.hotkey_manager.register_hotkey(
             self.config.hotkey_pause,
             self.pause,
@@ -623,13 +985,13 @@ class VoiceInputApp:
         def _show_settings():
             try:
                 import customtkinter as ctk
-                from tkinter import messagebox
-                import tkinter as tk
             except ImportError:
                 logger.error("CustomTkinter недоступен, окно настроек открыть нельзя")
                 return
+            tk, _, messagebox = _get_tk()
 
             import time
+            from audio_capture import AudioCapture
             self.settings_window_open = True
             self._settings_open_time = time.time()
             
@@ -652,7 +1014,7 @@ class VoiceInputApp:
                 'border': '#38383A',
             }
             
-            root = ctk.CTk()
+            root = ctk.CTkToplevel(self._tk_root)
             root.title("Настройки VoiceInput")
             root.resizable(True, True)  # Разрешаем изменение размера
             root.configure(fg_color=COLORS['bg'])
@@ -787,7 +1149,7 @@ class VoiceInputApp:
             # Сегментированная кнопка для выбора качества
             quality_segment = ctk.CTkSegmentedButton(
                 quality_content,
-                values=["⚡ Быстрое", "⚖️ Баланс", "🎯 Точное"],
+                values=list(QUALITY_PRESETS),
                 variable=quality_var,
                 corner_radius=8,
                 font=ctk.CTkFont(size=12),
@@ -801,39 +1163,61 @@ class VoiceInputApp:
             # =================================================================
             mic_content = create_card_scrollable(scroll_container, "🎤 Микрофон")
             
-            # Получаем список устройств
-            devices = AudioCapture.list_devices()
-            device_names = ["По умолчанию"] + [d['name'] for d in devices]
-            device_indices = [None] + [d['index'] for d in devices]
-            
-            # Текущий выбор
-            current_device_index = self.config.audio_device_index
-            current_selection = 0
-            if current_device_index is not None:
-                for i, idx in enumerate(device_indices):
-                    if idx == current_device_index:
-                        current_selection = i
-                        break
+            # Список устройств заполняется в фоне (перечисление PortAudio
+            # медленное), окно показывается сразу
+            device_names = ["По умолчанию"]
+            device_indices = [None]
             
             mic_row = ctk.CTkFrame(mic_content, fg_color="transparent")
             mic_row.pack(fill="x", pady=4)
             
-            device_var = ctk.StringVar(value=device_names[current_selection])
+            device_var = ctk.StringVar(value="Загрузка устройств…")
             device_combo = ctk.CTkComboBox(
                 mic_row,
                 variable=device_var,
                 values=device_names,
                 width=280,
                 corner_radius=8,
-                dropdown_hover_color=COLORS['accent']
+                dropdown_hover_color=COLORS['accent'],
+                state="disabled"
             )
             device_combo.pack(side="left", padx=(0, 8))
             
+            def populate_devices(devices):
+                """Заполнить список микрофонов (в потоке Tk)."""
+                if not root.winfo_exists():
+                    return  # Окно уже закрыто
+                device_names.extend(d['name'] for d in devices)
+                device_indices.extend(d['index'] for d in devices)
+                
+                # Текущий выбор
+                current_device_index = self.config.audio_device_index
+                current_selection = 0
+                if current_device_index is not None:
+                    for i, idx in enumerate(device_indices):
+                        if idx == current_device_index:
+                            current_selection = i
+                            break
+                
+                device_combo.configure(values=device_names, state="normal")
+                device_var.set(device_names[current_selection])
+            
+            def load_devices():
+                devices = AudioCapture.list_devices()
+                self._call_in_tk(populate_devices, devices)
+            
+            threading.Thread(target=load_devices, daemon=True).start()
+            
+            def selected_device_index():
+                """Индекс выбранного микрофона; пока список не загружен — текущий."""
+                selected_name = device_var.get()
+                if selected_name not in device_names:
+                    return self.config.audio_device_index
+                return device_indices[device_names.index(selected_name)]
+            
             def test_microphone():
                 """Тест выбранного микрофона."""
-                selected_name = device_var.get()
-                selected_idx = device_names.index(selected_name) if selected_name in device_names else 0
-                test_device_index = device_indices[selected_idx]
+                test_device_index = selected_device_index()
                 
                 try:
                     test_capture = AudioCapture(
@@ -1018,9 +1402,7 @@ class VoiceInputApp:
                 new_method = method_var.get().strip()
                 
                 # Получаем выбранный микрофон
-                selected_name = device_var.get()
-                selected_idx = device_names.index(selected_name) if selected_name in device_names else 0
-                new_device_index = device_indices[selected_idx]
+                new_device_index = selected_device_index()
                 
                 new_autostart = autostart_var.get()
                 new_quality = quality_var.get()
@@ -1034,57 +1416,66 @@ class VoiceInputApp:
                     return
 
                 try:
-                    # Сохраняем настройки
-                    self.config.set("hotkeys.toggle", new_toggle)
-                    self.config.set("hotkeys.pause", new_pause)
-                    self.config.set("hotkeys.hold_mode", new_hold_mode)
-                    self.config.set("input.method", new_method)
-                    self.config.set("audio.device_index", new_device_index)
+                    # Текущие горячие клавиши — чтобы перерегистрировать только изменённые
+                    old_toggle = self.config.hotkey_toggle
+                    old_pause = self.config.hotkey_pause
+                    old_hold_mode = self.config.hotkey_hold_mode
+                    # Параметры VAD — чтобы не пересоздавать его без изменений
+                    old_vad_params = (self.config.audio_sample_rate, self.config.vad_enabled)
+                    old_aggressiveness = self.config.vad_aggressiveness
+                    
+                    # Сохраняем настройки одним обновлением конфига
+                    updates = {
+                        "hotkeys.toggle": new_toggle,
+                        "hotkeys.pause": new_pause,
+                        "hotkeys.hold_mode": new_hold_mode,
+                        "input.method": new_method,
+                        "audio.device_index": new_device_index,
+                        "notifications.enabled": new_notif,
+                        "notifications.sound_enabled": new_sound,
+                        "check_updates": new_check_updates,
+                        "dark_theme": dark_theme_var.get(),
+                    }
                     
                     # Применяем предустановку качества (по названию из сегментированной кнопки)
-                    if "Быстрое" in new_quality:
-                        self.config.set("vad.aggressiveness", 3)
-                        self.config.set("audio.chunk_size", 8000)
-                    elif "Баланс" in new_quality:
-                        self.config.set("vad.aggressiveness", 2)
-                        self.config.set("audio.chunk_size", 8000)
-                    elif "Точное" in new_quality:
-                        self.config.set("vad.aggressiveness", 1)
-                        self.config.set("audio.chunk_size", 4000)
+                    preset = QUALITY_PRESETS.get(new_quality)
+                    if preset:
+                        updates["vad.aggressiveness"], updates["audio.chunk_size"] = preset
+                    
+                    self.config.update(updates)
                     
                     self.text_input.input_method = new_method
 
-                    self.hotkey_manager.unregister_all()
-                    self._register_hotkeys()
+                    toggle_changed = new_toggle != old_toggle or new_hold_mode != old_hold_mode
+                    pause_changed = new_pause != old_pause
+                    # Сначала снимаем все изменённые: новые клавиши могут совпасть со старыми
+                    if toggle_changed:
+                        self.hotkey_manager.unregister_hotkey(old_toggle)
+                    if pause_changed:
+                        self.hotkey_manager.unregister_hotkey(old_pause)
+                    if toggle_changed:
+                        self._register_toggle_hotkey()
+                    if pause_changed:
+                        self._register_pause_hotkey()
                     
-                    # Обновляем VAD с новыми настройками
-                    self.vad = VoiceActivityDetector(
-                        sample_rate=self.config.audio_sample_rate,
-                        aggressiveness=self.config.vad_aggressiveness,
-                        enabled=self.config.vad_enabled
-                    )
+                    # Обновляем VAD, только если его параметры изменились
+                    if (self.config.audio_sample_rate, self.config.vad_enabled) != old_vad_params:
+                        self.vad = VoiceActivityDetector(
+                            sample_rate=self.config.audio_sample_rate,
+                            aggressiveness=self.config.vad_aggressiveness,
+                            enabled=self.config.vad_enabled
+                        )
+                    elif self.config.vad_aggressiveness != old_aggressiveness:
+                        self.vad.set_aggressiveness(self.config.vad_aggressiveness)
                     
                     # Уведомления
-                    self.config.set("notifications.enabled", new_notif)
-                    self.config.set("notifications.sound_enabled", new_sound)
                     self.notifications.enabled = new_notif
                     self.audio_feedback.enabled = new_sound
                     
                     # Автозапуск
-                    if new_autostart != is_autostart_enabled():
-                        if set_autostart(new_autostart):
-                            status = "включён" if new_autostart else "отключён"
-                            logger.info(f"Автозапуск {status}")
-                        else:
-                            messagebox.showwarning("Предупреждение", "Не удалось изменить настройку автозапуска")
-                    
-                    # Проверка обновлений
-                    self.config.set("check_updates", new_check_updates)
+                    if not sync_autostart(new_autostart):
+                        messagebox.showwarning("Предупреждение", "Не удалось изменить настройку автозапуска")
                     
-                    # Тёмная тема
-                    new_dark_theme = dark_theme_var.get()
-                    self.config.set("dark_theme", new_dark_theme)
-
                     messagebox.showinfo("Готово", "Настройки сохранены.\nИзменения применятся при следующем запуске.")
                     on_close()
                 except Exception as e:
@@ -1178,7 +1569,7 @@ class VoiceInputApp:
             y = max(50, y)
             
             root.geometry(f"{window_width}x{window_height}+{x}+{y}")
-            logger.info(f"Окно настроек: {window_width}x{window_height} at ({x}, {y})")
+            logger.info("Окно настроек: %sx%s at (%s, %s)", window_width, window_height, x, y)
             
             # =================================================================
             # 🎬 FADE-IN АНИМАЦИЯ
@@ -1206,40 +1597,51 @@ class VoiceInputApp:
             # Запускаем fade-in
             fade_in()
 
+        def _open_settings():
             try:
-                root.mainloop()
+                _show_settings()
             except Exception as e:
-                logger.error(f"Ошибка в окне настроек: {e}")
-            finally:
-                # Гарантированный сброс флага
+                logger.error("Ошибка в окне настроек: %s", e, exc_info=True)
+                # Окно не открылось — сбрасываем флаг
                 self.settings_window_open = False
 
-        threading.Thread(target=_show_settings, daemon=True).start()
+        self._call_in_tk(_open_settings)
     
     def open_model_manager(self):
-        """Открытие окна управления моделями."""
+        """Открытие окна управления моделями (если уже открыто — поднимается)."""
         def _show_model_manager():
-            try:
-                import tkinter as tk
-                from tkinter import ttk, messagebox
-            except ImportError:
+            root = self._model_manager_root
+            if root is not None and root.winfo_exists():
+                self._refresh_model_rows()
+                root.deiconify()
+                root.lift()
+                return
+            
+            tk_modules = _get_tk()
+            if tk_modules is None:
                 logger.error("Tkinter недоступен")
                 return
+            tk, ttk, messagebox = tk_modules
             
-            root = tk.Tk()
+            root = tk.Toplevel(self._tk_root)
             root.title("Управление моделями")
             root.resizable(False, False)
             
+            def on_close():
+                self._model_manager_root = None
+                self._model_rows = {}
+                root.destroy()
+            
+            root.protocol("WM_DELETE_WINDOW", on_close)
+            
             # Основной фрейм
             main_frame = ttk.Frame(root, padding=10)
             main_frame.pack(fill=tk.BOTH, expand=True)
             
-            # Получаем список моделей
-            models = self.model_manager.get_available_models()
-            current_model = self.config.vosk_model_path
-            
-            # Список моделей
-            for i, model in enumerate(models):
+            # Строки моделей строятся один раз; кнопки и статус
+            # обновляются в _refresh_model_rows()
+            rows = {}
+            for model in AVAILABLE_MODELS:
                 model_frame = ttk.LabelFrame(
                     main_frame,
                     text=model['name'],
@@ -1264,69 +1666,50 @@ class VoiceInputApp:
                 button_frame.grid(row=1, column=1, columnspan=2, sticky="e")
                 
                 model_id = model['id']
-                model_path = f"models/{model_id}"
-                is_active = current_model.endswith(model_id)
                 
-                if model['is_downloaded']:
-                    # Модель скачана
-                    if is_active:
-                        ttk.Label(button_frame, text="✓ Активна", foreground="green").pack(side=tk.LEFT, padx=5)
-                    else:
-                        def make_active(mid=model_id, mp=model_path):
-                            self.config.set("vosk.model_path", mp)
-                            messagebox.showinfo(
-                                "Модель выбрана",
-                                f"Модель будет использована при следующем запуске распознавания."
-                            )
-                            root.destroy()
-                        
-                        ttk.Button(
-                            button_frame,
-                            text="Сделать активной",
-                            command=make_active
-                        ).pack(side=tk.LEFT, padx=2)
-                    
-                    # Кнопка удаления (если не активна)
-                    if not is_active:
-                        def delete_model(mid=model_id, mname=model['name']):
-                            if messagebox.askyesno(
-                                "Удалить модель?",
-                                f"Удалить модель {mname}?"
-                            ):
-                                if self.model_manager.delete_model(mid):
-                                    messagebox.showinfo("Готово", "Модель удалена")
-                                    root.destroy()
-                                    self.open_model_manager()  # Перезагрузить окно
-                                else:
-                                    messagebox.showerror("Ошибка", "Не удалось удалить модель")
-                        
-                        ttk.Button(
-                            button_frame,
-                            text="Удалить",
-                            command=delete_model
-                        ).pack(side=tk.LEFT, padx=2)
-                else:
-                    # Модель не скачана
-                    ttk.Label(button_frame, text="Не скачана", foreground="gray").pack(side=tk.LEFT, padx=5)
-                    
-                    def download_model(mid=model_id, mname=model['name']):
-                        # Открыть окно скачивания
-                        root.destroy()
-                        self._show_download_dialog(mid, mname)
-                    
-                    ttk.Button(
-                        button_frame,
-                        text="Скачать",
-                        command=download_model
-                    ).pack(side=tk.LEFT, padx=2)
+                def make_active(mid=model_id):
+                    self.config.set("vosk.model_path", f"models/{mid}")
+                    messagebox.showinfo(
+                        "Модель выбрана",
+                        f"Модель будет использована при следующем запуске распознавания.",
+                        parent=root
+                    )
+                    self._refresh_model_rows()
+                
+                def delete_model(mid=model_id, mname=model['name']):
+                    if messagebox.askyesno(
+                        "Удалить модель?",
+                        f"Удалить модель {mname}?",
+                        parent=root
+                    ):
+                        if self.model_manager.delete_model(mid):
+                            messagebox.showinfo("Готово", "Модель удалена", parent=root)
+                            self._refresh_model_rows()
+                        else:
+                            messagebox.showerror("Ошибка", "Не удалось удалить модель", parent=root)
+                
+                def download_model(mid=model_id, mname=model['name']):
+                    # Открыть окно скачивания; строки обновятся по завершении
+                    self._show_download_dialog(mid, mname)
+                
+                rows[model_id] = {
+                    'status': ttk.Label(button_frame),
+                    'activate': ttk.Button(button_frame, text="Сделать активной", command=make_active),
+                    'delete': ttk.Button(button_frame, text="Удалить", command=delete_model),
+                    'download': ttk.Button(button_frame, text="Скачать", command=download_model),
+                }
             
             # Кнопка закрытия
             ttk.Button(
                 main_frame,
                 text="Закрыть",
-                command=root.destroy
+                command=on_close
             ).pack(pady=10)
             
+            self._model_manager_root = root
+            self._model_rows = rows
+            self._refresh_model_rows()
+            
             # Центрирование
             root.update_idletasks()
             w = root.winfo_width()
@@ -1334,21 +1717,45 @@ class VoiceInputApp:
             x = (root.winfo_screenwidth() - w) // 2
             y = (root.winfo_screenheight() - h) // 2
             root.geometry(f"+{x}+{y}")
-            
-            root.mainloop()
         
-        threading.Thread(target=_show_model_manager, daemon=True).start()
+        self._call_in_tk(_show_model_manager)
+    
+    def _refresh_model_rows(self):
+        """Обновить статус и кнопки строк окна моделей (в потоке Tk)."""
+        if not self._model_rows:
+            return
+        
+        current_model = self.config.vosk_model_path
+        for model in self.model_manager.get_available_models():
+            row = self._model_rows.get(model['id'])
+            if row is None:
+                continue
+            
+            for widget in row.values():
+                widget.pack_forget()
+            
+            if model['is_downloaded']:
+                if current_model.endswith(model['id']):
+                    row['status'].configure(text="✓ Активна", foreground="green")
+                    row['status'].pack(side="left", padx=5)
+                else:
+                    # Неактивную модель можно выбрать или удалить
+                    row['activate'].pack(side="left", padx=2)
+                    row['delete'].pack(side="left", padx=2)
+            else:
+                row['status'].configure(text="Не скачана", foreground="gray")
+                row['status'].pack(side="left", padx=5)
+                row['download'].pack(side="left", padx=2)
     
     def _show_download_dialog(self, model_id: str, model_name: str):
         """Показать диалог скачивания модели с прогресс-баром."""
         def _download():
-            try:
-                import tkinter as tk
-                from tkinter import ttk, messagebox
-            except ImportError:
+            tk_modules = _get_tk()
+            if tk_modules is None:
                 return
+            tk, ttk, messagebox = tk_modules
             
-            root = tk.Tk()
+            root = tk.Toplevel(self._tk_root)
             root.title(f"Скачивание: {model_name}")
             root.resizable(False, False)
             root.protocol("WM_DELETE_WINDOW", lambda: None)  # Запретить закрытие
@@ -1385,22 +1792,20 @@ class VoiceInputApp:
             def on_progress(progress: float, status: str):
                 progress_var.set(progress * 100)
                 status_var.set(status)
-                root.update_idletasks()
             
             def on_complete(success: bool, message: str):
                 root.destroy()
                 if success:
                     self.notifications.show("VoiceInput", f"Модель {model_name} скачана!")
-                    # Переоткрыть менеджер моделей
-                    self.open_model_manager()
+                    manager = self._model_manager_root
+                    if manager is not None and manager.winfo_exists():
+                        # Окно менеджера открыто — обновляем его строки на месте
+                        self._refresh_model_rows()
+                    else:
+                        self.open_model_manager()
                 else:
                     if not cancel_pressed[0]:
-                        import tkinter as tk
-                        from tkinter import messagebox
-                        temp_root = tk.Tk()
-                        temp_root.withdraw()
-                        messagebox.showerror("Ошибка скачивания", message)
-                        temp_root.destroy()
+                        messagebox.showerror("Ошибка скачивания", message, parent=self._tk_root)
             
             # Центрирование
             root.update_idletasks()
@@ -1410,21 +1815,49 @@ class VoiceInputApp:
             y = (root.winfo_screenheight() - h) // 2
             root.geometry(f"+{x}+{y}")
             
-            # Запуск скачивания
+            # Прогресс из потока скачивания передаётся в поток Tk не чаще
+            # PROGRESS_UI_INTERVAL; этап распаковки (0.9) — всегда
+            last_progress_at = [0.0]
+            
+            def report_progress(progress: float, status: str):
+                now = time.monotonic()
+                if progress < 0.9 and now - last_progress_at[0] < PROGRESS_UI_INTERVAL:
+                    return
+                last_progress_at[0] = now
+                self._call_in_tk(on_progress, progress, status)
+            
+            # Запуск скачивания; колбэки приходят из потока скачивания
+            # и передаются в поток Tk
             self.model_manager.download_model(
                 model_id,
-                on_progress=on_progress,
-                on_complete=on_complete
+                on_progress=report_progress,
+                on_complete=lambda *a: self._call_in_tk(on_complete, *a)
             )
-            
-            root.mainloop()
         
-        threading.Thread(target=_download, daemon=True).start()
+        self._call_in_tk(_download)
 
 
 # === Single Instance (Mutex) ===
 _mutex_handle = None
 
+MUTEX_NAME = "VoiceInput_SingleInstance_Mutex"
+ERROR_ALREADY_EXISTS = 183
+
+# Функции kernel32 с явными сигнатурами: HANDLE не обрезается до int
+# на 64-битной Windows, код ошибки берётся из ctypes.get_last_error()
+if sys.platform == 'win32':
+    from ctypes import wintypes
+    
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    
+    _CreateMutexW = _kernel32.CreateMutexW
+    _CreateMutexW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.LPCWSTR]
+    _CreateMutexW.restype = wintypes.HANDLE
+    
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+
 def check_single_instance():
     """
     Проверяет, что запущен только один экземпляр приложения.
@@ -1432,15 +1865,10 @@ def check_single_instance():
     """
     global _mutex_handle
     
-    MUTEX_NAME = "VoiceInput_SingleInstance_Mutex"
-    
-    # CreateMutexW
-    kernel32 = ctypes.windll.kernel32
-    _mutex_handle = kernel32.CreateMutexW(None, False, MUTEX_NAME)
+    _mutex_handle = _CreateMutexW(None, False, MUTEX_NAME)
     
-    ERROR_ALREADY_EXISTS = 183
-    if kernel32.GetLastError() == ERROR_ALREADY_EXISTS:
-        kernel32.CloseHandle(_mutex_handle)
+    if ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+        _CloseHandle(_mutex_handle)
         _mutex_handle = None
         return False
     
@@ -1450,7 +1878,7 @@ def release_mutex():
     """Освобождает mutex при завершении."""
     global _mutex_handle
     if _mutex_handle:
-        ctypes.windll.kernel32.CloseHandle(_mutex_handle)
+        _CloseHandle(_mutex_handle)
         _mutex_handle = None
 
 
@@ -54,22 +54,64 @@ class ModelManager:
         self._download_cancel = False
         self._download_progress = 0.0
         self._download_status = ""
+        
+        # Снимок каталога моделей: id -> путь (см. get_downloaded_paths),
+        # mtime каталога на момент снимка и построенный по нему список моделей
+        self._downloaded: Optional[Dict[str, Path]] = None
+        self._downloaded_mtime: Optional[int] = None
+        self._available: Optional[List[Dict]] = None
+    
+    def get_downloaded_paths(self) -> Dict[str, Path]:
+        """
+        Получить скачанные модели одним проходом по каталогу.
+        
+        Результат кэшируется и сбрасывается после скачивания или удаления,
+        а также при изменении mtime каталога (модель добавлена вручную).
+        
+        Returns:
+            Словарь {id модели: путь к папке модели}
+        """
+        try:
+            mtime = os.stat(self.models_dir).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        # Локальный снимок: другой поток может сбросить self._downloaded в None
+        downloaded = self._downloaded
+        if downloaded is None or mtime != self._downloaded_mtime:
+            downloaded = {}
+            try:
+                with os.scandir(self.models_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            downloaded[entry.name] = Path(entry.path)
+            except OSError as e:
+                logger.warning(f"Не удалось прочитать каталог моделей: {e}")
+            self._downloaded = downloaded
+            self._downloaded_mtime = mtime
+            self._available = None
+        return downloaded
     
     def get_available_models(self) -> List[Dict]:
         """
         Получить список доступных моделей.
         
+        Список кэшируется вместе со снимком каталога; не изменяйте его.
+        
         Returns:
             Список словарей с информацией о моделях
         """
-        models = []
-        for model_info in AVAILABLE_MODELS:
-            model = model_info.copy()
-            model_path = self.models_dir / model["id"]
-            model["is_downloaded"] = model_path.exists()
-            model["path"] = str(model_path) if model["is_downloaded"] else None
-            models.append(model)
-        return models
+        downloaded = self.get_downloaded_paths()
+        if self._available is None:
+            models = []
+            for model_info in AVAILABLE_MODELS:
+                model = model_info.copy()
+                model_path = downloaded.get(model["id"])
+                model["is_downloaded"] = model_path is not None
+                model["path"] = str(model_path) if model_path is not None else None
+                models.append(model)
+            self._available = models
+        return self._available
     
     def get_downloaded_models(self) -> List[Dict]:
         """
@@ -198,6 +240,7 @@ class ModelManager:
             
             # Удаление zip
             zip_path.unlink()
+            self._downloaded = None
             
             # Проверка
             if extract_path.exists():
@@ -266,6 +309,7 @@ class ModelManager:
         
         try:
             shutil.rmtree(model_path)
+            self._downloaded = None
             logger.info(f"Модель {model_id} удалена")
             return True
         except Exception as e:
@@ -63,12 +63,13 @@ class SpeechRecognition:
             logger.error(f"Ошибка при загрузке модели Vosk: {e}")
             raise
     
-    def recognize_chunk(self, audio_chunk):
+    def recognize_chunk(self, audio_chunk, partial=True):
         """
         Распознавание текста из аудио чанка.
         
         Args:
             audio_chunk: Байты аудиоданных
+            partial: Запрашивать ли частичный результат, пока фраза не закончена
         
         Returns:
             Кортеж (text, is_final) где text - распознанный текст, is_final - финальный ли результат
@@ -85,7 +86,7 @@ class SpeechRecognition:
                 if text:
                     logger.debug(f"Распознан текст (финальный): {text}")
                     return text, True
-            else:
+            elif partial:
                 # Частичный результат
                 result = json.loads(self.recognizer.PartialResult())
                 text = result.get("partial", "").strip()
@@ -142,12 +143,13 @@ class SpeechRecognition:
             if text:
                 yield text, is_final
     
-    def switch_model(self, new_model_path: str) -> bool:
+    def switch_model(self, new_model_path: str, model=None) -> bool:
         """
         Переключение на другую модель.
         
         Args:
             new_model_path: Путь к новой модели
+            model: Уже загруженная vosk.Model для этого пути (если None — загружается здесь)
             
         Returns:
             True если успешно, False иначе
@@ -161,8 +163,8 @@ class SpeechRecognition:
         try:
             logger.info(f"Переключение модели: {self.model_path} → {new_path}")
             
-            # Загрузка новой модели
-            new_model = vosk.Model(str(new_path))
+            # Загрузка новой модели (если не загружена заранее)
+            new_model = model if model is not None else vosk.Model(str(new_path))
             new_recognizer = vosk.KaldiRecognizer(new_model, self.sample_rate)
             
             if self.words:
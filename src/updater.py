@@ -181,7 +181,7 @@ class UpdateChecker:
             
             # Прогресс-бар (скрыт по умолчанию)
             progress_frame = ttk.Frame(frame)
-            progress_var = tk.DoubleVar(value=0)
+            progress_var = tk.DoubleVar(master=root, value=0)
             progress_bar = ttk.Progressbar(
                 progress_frame, 
                 variable=progress_var,
@@ -78,7 +78,7 @@ class VoiceActivityDetector:
         Проверяет, содержит ли аудио-чанк речь.
         
         Args:
-            audio_chunk: Аудио данные в формате 16-bit PCM
+            audio_chunk: Аудио данные в формате 16-bit PCM (bytes или memoryview)
         
         Returns:
             True если обнаружена речь, False если тишина
@@ -91,8 +91,12 @@ class VoiceActivityDetector:
         total_frames = 0
         offset = 0
         
-        while offset + self._frame_size <= len(audio_chunk):
-            frame = audio_chunk[offset:offset + self._frame_size]
+        # Срезы memoryview не копируют данные — фреймы читаются прямо из чанка
+        view = memoryview(audio_chunk)
+        chunk_len = len(view)
+        
+        while offset + self._frame_size <= chunk_len:
+            frame = view[offset:offset + self._frame_size]
             try:
                 if self.vad.is_speech(frame, self.sample_rate):
                     speech_frames += 1
@@ -131,6 +135,22 @@ class VoiceActivityDetector:
         
         return self._triggered
     
+    def set_aggressiveness(self, aggressiveness: int):
+        """
+        Изменить агрессивность без пересоздания детектора.
+        
+        Args:
+            aggressiveness: Агрессивность фильтрации 0-3
+        """
+        if self.vad is not None:
+            try:
+                self.vad.set_mode(aggressiveness)
+            except Exception as e:
+                logger.error(f"Ошибка изменения агрессивности VAD: {e}")
+                return
+        self.aggressiveness = aggressiveness
+        logger.info(f"VAD: aggressiveness={aggressiveness}")
+    
     def reset(self):
         """Сброс состояния VAD (например, при перезапуске распознавания)."""
         self._ring_buffer.clear()
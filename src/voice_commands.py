@@ -19,6 +19,7 @@ class VoiceCommands:
         self.commands = commands_dict or {}
         # Нормализация команд (приведение к нижнему регистру)
         self.commands_normalized = {k.lower(): v for k, v in self.commands.items()}
+        self._pattern = self._compile(self.commands_normalized)
         logger.info(f"Загружено {len(self.commands)} голосовых команд")
     
     def update_commands(self, commands_dict):
@@ -30,8 +31,28 @@ class VoiceCommands:
         """
         self.commands = commands_dict
         self.commands_normalized = {k.lower(): v for k, v in self.commands.items()}
+        self._pattern = self._compile(self.commands_normalized)
         logger.info(f"Обновлено {len(self.commands)} голосовых команд")
     
+    @staticmethod
+    def _compile(commands):
+        """
+        Собирает все команды в одно регулярное выражение.
+        
+        Длинные команды идут первыми, чтобы "точка с запятой" не разбивалась
+        на "точка" + остаток.
+        
+        Args:
+            commands: Нормализованный словарь команд
+        
+        Returns:
+            Скомпилированный шаблон или None, если команд нет
+        """
+        if not commands:
+            return None
+        alternation = '|'.join(re.escape(c) for c in sorted(commands, key=len, reverse=True))
+        return re.compile(r'\b(?:' + alternation + r')\b', re.IGNORECASE)
+    
     def process_text(self, text):
         """
         Обработка текста: замена голосовых команд на символы.
@@ -45,14 +66,12 @@ class VoiceCommands:
         if not text:
             return text
         
-        processed_text = text
+        if self._pattern is None:
+            return text
         
-        # Проходим по всем командам и заменяем их
-        for command, replacement in self.commands_normalized.items():
-            # Используем регулярное выражение для поиска команды как отдельного слова
-            # Учитываем регистр и границы слов
-            pattern = r'\b' + re.escape(command) + r'\b'
-            processed_text = re.sub(pattern, replacement, processed_text, flags=re.IGNORECASE)
+        # Один проход по тексту вместо отдельного re.sub на каждую команду
+        commands = self.commands_normalized
+        processed_text = self._pattern.sub(lambda m: commands[m.group(0).lower()], text)
         
         if processed_text != text:
             logger.debug(f"Текст обработан: '{text}' -> '{processed_text}'")